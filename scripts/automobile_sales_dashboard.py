@@ -8,26 +8,22 @@ This dashboard provides insights into automobile sales data with two main report
 2. Recession Period Statistics
 """
 
+import functools
+import os
 import pandas as pd
 import numpy as np
 import dash
 from dash import dcc, html, Input, Output
 import plotly.express as px
-from datetime import datetime, timedelta
+from figure_slimming import record_payload, register_metrics_route, slim_figures
+from shared_frames import attach_shared, default_shared_dir, source_hash
+from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
 # Initialize the Dash app
 app = dash.Dash(__name__)
 
-# Create sample automobile sales dataset (enhanced for dashboard requirements)
-np.random.seed(42)
-
-# Create date range from 1980 to 2013 (as per requirements)
-start_date = datetime(1980, 1, 1)
-end_date = datetime(2013, 12, 31)
-date_range = pd.date_range(start_date, end_date, freq='M')
-
 # Define recession periods (historical US recessions between 1980-2013)
 recession_periods = [
     (datetime(1980, 1, 1), datetime(1980, 7, 31)),    # 1980 recession
@@ -40,88 +36,222 @@ recession_periods = [
 # Vehicle types as per dataset specification
 vehicle_types = ['Supperminicar', 'Smallfamiliycar', 'Mediumfamilycar', 'Executivecar', 'Sports']
 
-# Create the comprehensive dataset
-data = []
-for date in date_range:
-    # Determine if in recession
-    is_recession = any(start <= date <= end for start, end in recession_periods)
-    
-    for vehicle_type in vehicle_types:
-        # Base sales influenced by recession, seasonality, and trends
-        base_sales = np.random.normal(1000, 200)
-        
-        # Recession effect
-        if is_recession:
-            base_sales *= 0.6  # 40% reduction during recession
-        
-        # Seasonality effect (higher sales in spring/summer)
-        seasonal_factor = 1 + 0.3 * np.sin(2 * np.pi * date.month / 12)
-        base_sales *= seasonal_factor
-        
-        # Vehicle type popularity
-        type_multiplier = {
-            'Supperminicar': 0.8, 
-            'Smallfamiliycar': 1.2, 
-            'Mediumfamilycar': 1.5, 
-            'Executivecar': 1.1, 
-            'Sports': 0.7
-        }
-        base_sales *= type_multiplier[vehicle_type]
-        
-        # Ensure positive sales
-        automobile_sales = max(100, int(base_sales))
-        
-        # Generate other variables
-        gdp = np.random.normal(25000, 3000) * (0.9 if is_recession else 1.0)
-        unemployment_rate = np.random.normal(8.5 if is_recession else 5.5, 1)
-        unemployment_rate = max(3, min(15, unemployment_rate))
-        
-        # Consumer confidence
-        consumer_confidence = np.random.normal(70 if not is_recession else 45, 10)
-        consumer_confidence = max(20, min(100, consumer_confidence))
-        
-        # Seasonality weight
-        seasonality_weight = 1 + 0.2 * np.sin(2 * np.pi * date.month / 12)
-        
-        # Price variations
-        base_price = {
-            'Supperminicar': 15000, 
-            'Smallfamiliycar': 20000, 
-            'Mediumfamilycar': 30000, 
-            'Executivecar': 45000, 
-            'Sports': 60000
-        }
-        price_variation = np.random.normal(1, 0.15)
-        price = base_price[vehicle_type] * price_variation
-        
-        # Advertising expenditure
-        base_ad_spend = np.random.normal(800000, 150000)
-        if is_recession:
-            base_ad_spend *= 0.7  # Reduced spending during recession
-        advertising_expenditure = max(100000, base_ad_spend)
-        
-        # Competition measure
-        competition = np.random.normal(5, 1.5)
-        competition = max(1, min(10, competition))
-        
-        data.append({
-            'Date': date,
-            'Recession': 1 if is_recession else 0,
-            'Automobile_Sales': automobile_sales,
-            'GDP': gdp,
-            'unemployment_rate': unemployment_rate,
-            'Consumer_Confidence': consumer_confidence,
-            'Seasonality_Weight': seasonality_weight,
-            'Price': price,
-            'Advertising_Expenditure': advertising_expenditure,
-            'Vehicle_Type': vehicle_type,
-            'Competition': competition,
-            'Month': date.month,
-            'Year': date.year
-        })
-
-# Create DataFrame
-data = pd.DataFrame(data)
+# Vehicle type popularity and base prices (same order as vehicle_types)
+type_multiplier = np.array([0.8, 1.2, 1.5, 1.1, 0.7])
+base_price = np.array([15000, 20000, 30000, 45000, 60000])
+
+
+def recession_mask(dates):
+    """Flag dates that fall inside one of the recession periods (interval lookup)"""
+    starts = np.array([start for start, _ in recession_periods], dtype='datetime64[ns]')
+    ends = np.array([end for _, end in recession_periods], dtype='datetime64[ns]')
+    values = np.asarray(dates, dtype='datetime64[ns]')
+    # Index of the last period starting on or before each date
+    idx = np.searchsorted(starts, values, side='right') - 1
+    return (idx >= 0) & (values <= ends[np.clip(idx, 0, None)])
+
+
+def generate_sales_data(start_date=datetime(1980, 1, 1), end_date=datetime(2013, 12, 31),
+                        samples_per_cell=1, seed=42):
+    """Generate the synthetic automobile sales dataset
+
+    Builds a month x vehicle-type grid with NumPy broadcasting and draws every
+    noise column in a single batched call, so large load-test datasets
+    (10M+ rows via samples_per_cell) are produced in seconds.
+
+    Arguments:
+        start_date, end_date: Period covered by the monthly grid.
+        samples_per_cell: Number of rows generated per (month, vehicle type).
+        seed: Seed for the random generator, output is reproducible.
+
+    Returns:
+        DataFrame with one row per month, vehicle type and sample.
+    """
+    rng = np.random.default_rng(seed)
+
+    # Create date range (month ends) and determine recession months
+    dates = pd.date_range(start_date, end_date, freq='ME')
+    is_recession_month = recession_mask(dates)
+
+    # Month x vehicle type x sample grid, flattened month-major
+    shape = (len(dates), len(vehicle_types), samples_per_cell)
+    month_idx = np.broadcast_to(np.arange(shape[0])[:, None, None], shape).ravel()
+    type_idx = np.broadcast_to(np.arange(shape[1])[None, :, None], shape).ravel()
+    n = month_idx.size
+
+    is_recession = is_recession_month[month_idx]
+    month = dates.month.to_numpy()[month_idx]
+
+    # Base sales influenced by recession (40% reduction), seasonality and vehicle popularity
+    seasonal_factor = 1 + 0.3 * np.sin(2 * np.pi * month / 12)
+    base_sales = rng.normal(1000, 200, n) * np.where(is_recession, 0.6, 1.0)
+    base_sales *= seasonal_factor * type_multiplier[type_idx]
+    automobile_sales = np.maximum(100, base_sales.astype(np.int64))
+
+    # Generate other variables
+    gdp = rng.normal(25000, 3000, n) * np.where(is_recession, 0.9, 1.0)
+    unemployment_rate = np.clip(rng.normal(np.where(is_recession, 8.5, 5.5), 1), 3, 15)
+    consumer_confidence = np.clip(rng.normal(np.where(is_recession, 45, 70), 10), 20, 100)
+    seasonality_weight = 1 + 0.2 * np.sin(2 * np.pi * month / 12)
+    price = base_price[type_idx] * rng.normal(1, 0.15, n)
+
+    # Advertising expenditure, reduced spending during recession
+    base_ad_spend = rng.normal(800000, 150000, n) * np.where(is_recession, 0.7, 1.0)
+    advertising_expenditure = np.maximum(100000, base_ad_spend)
+    competition = np.clip(rng.normal(5, 1.5, n), 1, 10)
+
+    return pd.DataFrame({
+        'Date': dates.to_numpy()[month_idx],
+        'Recession': is_recession.astype(np.int8),
+        'Automobile_Sales': automobile_sales,
+        'GDP': gdp,
+        'unemployment_rate': unemployment_rate,
+        'Consumer_Confidence': consumer_confidence,
+        'Seasonality_Weight': seasonality_weight,
+        'Price': price,
+        'Advertising_Expenditure': advertising_expenditure,
+        'Vehicle_Type': pd.Categorical.from_codes(type_idx, vehicle_types),
+        'Competition': competition,
+        'Month': month.astype(np.int8),
+        'Year': dates.year.to_numpy()[month_idx].astype(np.int16)
+    })
+
+
+# Create sample automobile sales dataset (enhanced for dashboard requirements)
+# Set DASHBOARD_SAMPLES_PER_CELL to load-test the dashboard with larger datasets
+samples_per_cell = int(os.environ.get('DASHBOARD_SAMPLES_PER_CELL', 1))
+if os.environ.get('DASHBOARD_SHARED_DATA') == '1':
+    # Generated once and memory-mapped by every worker process (see shared_frames.py); the generator
+    # source and its constants are part of the key, so editing them republishes the data
+    generator = source_hash(generate_sales_data, recession_mask, recession_periods, vehicle_types,
+                            type_multiplier.tolist(), base_price.tolist())
+    data = attach_shared(default_shared_dir('automobile_sales'),
+                         lambda: {'data': generate_sales_data(samples_per_cell=samples_per_cell)},
+                         key={'samples_per_cell': samples_per_cell, 'seed': 42,
+                              'generator': generator})[0]['data']
+else:
+    data = generate_sales_data(samples_per_cell=samples_per_cell)
+
+
+def build_aggregate_cube(df):
+    """Pre-aggregate sales and advertising by (Year, Month, Vehicle_Type, Recession)
+
+    Sums and counts are kept per cell so any roll-up (sum or mean) can be
+    derived exactly without going back to the row-level data.
+    """
+    return df.groupby(['Year', 'Month', 'Vehicle_Type', 'Recession'], observed=True).agg(
+        Automobile_Sales_sum=('Automobile_Sales', 'sum'),
+        Automobile_Sales_count=('Automobile_Sales', 'count'),
+        Advertising_Expenditure_sum=('Advertising_Expenditure', 'sum'),
+        Advertising_Expenditure_count=('Advertising_Expenditure', 'count')
+    ).reset_index()
+
+
+def rollup(cube, by, column, how='mean'):
+    """Roll the aggregate cube up to the given keys, returning sum or mean of column"""
+    grouped = cube.groupby(by, observed=True)[[column + '_sum', column + '_count']].sum()
+    if how == 'sum':
+        values = grouped[column + '_sum']
+    else:
+        values = grouped[column + '_sum'] / grouped[column + '_count']
+    return values.rename(column).reset_index()
+
+
+# Continuous recession drivers charted against sales, binned so chart cost is bounded by the bin count
+# (binned_aggregate() works the same for other drivers such as GDP or Consumer_Confidence)
+RECESSION_DRIVERS = {'unemployment_rate': 'Unemployment Rate'}
+DRIVER_BINS = int(os.environ.get('DASHBOARD_DRIVER_BINS', 20))
+# 'uniform' (fixed-width) or 'quantile' (equal-count) bins
+DRIVER_BIN_STRATEGY = os.environ.get('DASHBOARD_DRIVER_BIN_STRATEGY', 'uniform')
+
+
+def bin_edges(values, bins=DRIVER_BINS, strategy=DRIVER_BIN_STRATEGY):
+    """Bin edges for a continuous column, fixed-width or quantile based
+
+    Always returns at least two edges: a constant column gives a single bin.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if strategy not in ('uniform', 'quantile'):
+        raise ValueError('Unknown bin strategy {!r}, expected uniform or quantile'.format(strategy))
+    low, high = values.min(), values.max()
+    if low == high:
+        return np.array([low, high])
+    if strategy == 'quantile':
+        # Repeated values can collapse quantiles, keep distinct edges only (min and max always differ here)
+        return np.unique(np.quantile(values, np.linspace(0, 1, bins + 1)))
+    return np.linspace(low, high, bins + 1)
+
+
+def bin_labels(edges):
+    """Distinct 'low–high' labels in fixed-point notation with thousands separators
+
+    Decimals follow the narrowest bin width (e.g. '3.6–4.2' for unemployment,
+    '14,770–15,160' for GDP) and are increased until adjacent bins print differently.
+    """
+    widths = np.diff(edges)
+    width = widths[widths > 0].min() if (widths > 0).any() else 1.0
+    decimals = max(0, -int(np.floor(np.log10(width))))
+    for digits in range(decimals, decimals + 12):
+        labels = ['{:,.{d}f}–{:,.{d}f}'.format(low, high, d=digits) for low, high in zip(edges[:-1], edges[1:])]
+        if len(set(labels)) == len(labels):
+            return labels
+    # Only a single-value bin can still repeat a label: prefix the bin number
+    return ['{}: {}'.format(i + 1, label) for i, label in enumerate(labels)]
+
+
+def binned_aggregate(df, driver, column, by='Vehicle_Type', bins=DRIVER_BINS, strategy=DRIVER_BIN_STRATEGY):
+    """Sum and count of column per (driver bin, by category) with digitize + bincount
+
+    Arguments:
+        df: Row-level data with a numeric driver column and a categorical by column.
+        driver: Continuous column to bin (e.g. unemployment_rate).
+        column: Column to aggregate.
+        by: Categorical column kept as a second key.
+        bins: Number of bins.
+        strategy: 'uniform' or 'quantile'.
+
+    Returns:
+        DataFrame with one row per non-empty (bin, category) cell: a bin label
+        ordered by bin, the bin center, the category and column_sum/column_count
+        (same layout as the aggregate cube, so rollup() applies).
+    """
+    values = df[driver].to_numpy(np.float64)
+    edges = bin_edges(values, bins, strategy)
+    n_bins = len(edges) - 1
+    # Interior edges only: the minimum falls in bin 0 and the maximum in the last bin
+    bin_idx = np.digitize(values, edges[1:-1])
+    categories = df[by].astype('category').cat
+    cell = bin_idx * len(categories.categories) + categories.codes.to_numpy()
+    n_cells = n_bins * len(categories.categories)
+    sums = np.bincount(cell, weights=df[column].to_numpy(np.float64), minlength=n_cells)
+    counts = np.bincount(cell, minlength=n_cells)
+
+    filled = np.flatnonzero(counts)
+    cell_bin, cell_category = np.divmod(filled, len(categories.categories))
+    labels = bin_labels(edges)
+    return pd.DataFrame({
+        driver: pd.Categorical.from_codes(cell_bin, labels),
+        driver + '_center': ((edges[:-1] + edges[1:]) / 2)[cell_bin],
+        by: pd.Categorical.from_codes(cell_category, categories.categories),
+        column + '_sum': sums[filled],
+        column + '_count': counts[filled]
+    })
+
+
+# Aggregates computed once at load time; callbacks only slice these
+sales_cube = build_aggregate_cube(data)
+recession_cube = sales_cube[sales_cube['Recession'] == 1]
+yas = rollup(sales_cube, 'Year', 'Automobile_Sales')
+
+
+def build_driver_cubes(df):
+    """Binned sales aggregates of the recession rows for every recession driver"""
+    # The recession rows are only needed while binning, no row-level copy is kept
+    recession_data = df[df['Recession'] == 1]
+    return {driver: binned_aggregate(recession_data, driver, 'Automobile_Sales') for driver in RECESSION_DRIVERS}
+
+
+driver_cubes = build_driver_cubes(data)
 
 # Year list for dropdown
 year_list = [i for i in range(1980, 2014, 1)]
@@ -173,111 +303,169 @@ app.layout = html.Div([
 # TASK 2.4: Creating Callbacks; Define the callback function to update the input container based on the selected statistics and the output container
 
 # Update Input Container callback function
-@app.callback(
+# Pure UI toggle, run in the browser as a clientside callback: no server round-trip
+app.clientside_callback(
+    """
+    function update_input_container(selected_statistics) {
+        return selected_statistics !== 'Yearly Statistics';
+    }
+    """,
     Output(component_id='select-year', component_property='disabled'),
     Input(component_id='dropdown-statistics', component_property='value'))
-def update_input_container(selected_statistics):
-    if selected_statistics == 'Yearly Statistics': 
-        return False
-    else: 
-        return True
 
-# Update Output Container callback function
-@app.callback(
-    Output(component_id='output-container', component_property='children'),
-    [Input(component_id='dropdown-statistics', component_property='value'), 
-     Input(component_id='select-year', component_property='value')])
-def update_output_container(selected_statistics, input_year):
+# Report figures are memoized per (report type, year): there are only
+# 1 + len(year_list) distinct reports, so repeat selections skip plotly entirely.
+FIGURE_CACHE_SIZE = int(os.environ.get('DASHBOARD_FIGURE_CACHE_SIZE', 64))
+
+# Cache key -> (payload bytes before slimming, after slimming), filled on each build
+payload_sizes = {}
+
+
+def report_cache_key(selected_statistics, input_year):
+    """Normalize callback inputs to a cache key, None when there is nothing to plot"""
+    if selected_statistics == 'Recession Period Statistics':
+        # The recession report does not depend on the selected year
+        return (selected_statistics, None)
+    elif selected_statistics == 'Yearly Statistics':
+        # The year dropdown starts on the 'Select-year' placeholder: no report until a listed year is picked
+        try:
+            year = int(input_year)
+        except (TypeError, ValueError):
+            return None
+        if year in year_list:
+            return (selected_statistics, year)
+    return None
+
+
+def driver_bar_chart(driver):
+    """Average recession sales per binned driver value and vehicle type"""
+    label = RECESSION_DRIVERS[driver]
+    driver_data = rollup(driver_cubes[driver], [driver, 'Vehicle_Type'], 'Automobile_Sales')
+    return px.bar(driver_data,
+        x=driver,
+        y='Automobile_Sales',
+        color='Vehicle_Type',
+        category_orders={driver: list(driver_cubes[driver][driver].cat.categories)},
+        labels={driver: label, 'Automobile_Sales': 'Average Automobile Sales'},
+        title='Effect of {} on Vehicle Type and Sales'.format(label))
+
+
+@functools.lru_cache(maxsize=FIGURE_CACHE_SIZE)
+def build_report_figures(selected_statistics, input_year):
+    """Build the report figures as slimmed plotly JSON dicts (LRU cached)
+
+    Use build_report_figures.cache_info() for hit/miss counters and
+    build_report_figures.cache_clear() to invalidate after reloading data.
+    """
     
     # TASK 2.5: Create and display graphs for Recession Report Statistics
     if selected_statistics == 'Recession Period Statistics':
-        # Filter the data for recession periods
-        recession_data = data[data['Recession'] == 1]
-        
         # Plot 1: Automobile sales fluctuate over Recession Period (year wise) using line chart
-        # Grouping data for plotting
-        yearly_rec = recession_data.groupby('Year')['Automobile_Sales'].mean().reset_index()
+        # Rolling up the recession slice of the aggregate cube for plotting
+        yearly_rec = rollup(recession_cube, 'Year', 'Automobile_Sales')
         # Plotting the line graph
-        R_chart1 = dcc.Graph(
-            figure=px.line(yearly_rec, 
+        R_chart1 = px.line(yearly_rec, 
                 x='Year',
                 y='Automobile_Sales',
-                title="Average Automobile Sales fluctuation over Recession Period"))
+                title="Average Automobile Sales fluctuation over Recession Period")
         
         # Plot 2: Calculate the average number of vehicles sold by vehicle type and represent as a Bar chart
-        # Use groupby to create relevant data for plotting. 
-        average_sales = recession_data.groupby('Vehicle_Type')['Automobile_Sales'].mean().reset_index()                 
-        R_chart2 = dcc.Graph(
-            figure=px.bar(average_sales,
+        # Use the aggregate cube to create relevant data for plotting.
+        average_sales = rollup(recession_cube, 'Vehicle_Type', 'Automobile_Sales')                 
+        R_chart2 = px.bar(average_sales,
             x='Vehicle_Type',
             y='Automobile_Sales',
-            title="Average Number of Vehicles Sold by Vehicle Type"))
+            title="Average Number of Vehicles Sold by Vehicle Type")
         
         # Plot 3: Pie chart for total expenditure share by vehicle type during recessions
-        # Grouping data for plotting
-        exp_rec = recession_data.groupby('Vehicle_Type')['Advertising_Expenditure'].sum().reset_index()
-        R_chart3 = dcc.Graph(
-            figure=px.pie(exp_rec,
+        # Rolling up the aggregate cube for plotting
+        exp_rec = rollup(recession_cube, 'Vehicle_Type', 'Advertising_Expenditure', how='sum')
+        R_chart3 = px.pie(exp_rec,
                 values='Advertising_Expenditure',
                 names='Vehicle_Type',
-                title="Total Expenditure Share by Vehicle Type During Recessions"))
+                title="Total Expenditure Share by Vehicle Type During Recessions")
         
         # Plot 4: Develop a Bar chart for the effect of unemployment rate on vehicle type and sales
-        # Grouping data for plotting
-        unemp_data = recession_data.groupby(['unemployment_rate', 'Vehicle_Type'])['Automobile_Sales'].mean().reset_index()
-        R_chart4 = dcc.Graph(figure=px.bar(unemp_data,
-            x='unemployment_rate',
-            y='Automobile_Sales',
-            color='Vehicle_Type',
-            labels={'unemployment_rate': 'Unemployment Rate', 'Automobile_Sales': 'Average Automobile Sales'},
-            title='Effect of Unemployment Rate on Vehicle Type and Sales'))
-        
-        return [
-            html.Div(className='chart-item', children=[html.Div(children=R_chart1), html.Div(children=R_chart2)], style={'display': 'flex'}),
-            html.Div(className='chart-item', children=[html.Div(children=R_chart3), html.Div(children=R_chart4)], style={'display': 'flex'})
-        ]
+        # Rolling up the binned unemployment rate cube for plotting
+        R_chart4 = driver_bar_chart('unemployment_rate')
+
+        figures = (R_chart1, R_chart2, R_chart3, R_chart4)
     
     # TASK 2.6: Create and display graphs for Yearly Report Statistics
     # Yearly Statistic Report Plots 
     # Check for Yearly Statistics.
     elif (input_year and selected_statistics == 'Yearly Statistics'):
-        yearly_data = data[data['Year'] == input_year]
+        yearly_cube = sales_cube[sales_cube['Year'] == input_year]
         
         # Plot 1: Yearly Automobile sales using line chart for the whole period.
-        # Grouping data for plotting.
-        yas = data.groupby('Year')['Automobile_Sales'].mean().reset_index()
-        Y_chart1 = dcc.Graph(figure=px.line(yas, x='Year', y='Automobile_Sales', title='Yearly Automobile Sales for the Whole Period'))
+        # Precomputed at load time since it does not depend on the selected year.
+        Y_chart1 = px.line(yas, x='Year', y='Automobile_Sales', title='Yearly Automobile Sales for the Whole Period')
         
         # Plot 2: Total Monthly Automobile sales using line chart.
-        # Grouping data for plotting.
-        mas = yearly_data.groupby('Month')['Automobile_Sales'].sum().reset_index()
-        Y_chart2 = dcc.Graph(figure=px.line(mas,
+        # Rolling up the aggregate cube for plotting.
+        mas = rollup(yearly_cube, 'Month', 'Automobile_Sales', how='sum')
+        Y_chart2 = px.line(mas,
             x='Month',
             y='Automobile_Sales',
-            title='Total Monthly Automobile Sales'))
+            title='Total Monthly Automobile Sales')
         
         # Plot bar chart for average number of vehicles sold during the given year
-        # Grouping data for plotting.
-        avr_vdata = yearly_data.groupby('Vehicle_Type')['Automobile_Sales'].mean().reset_index()
-        Y_chart3 = dcc.Graph(figure=px.bar(avr_vdata, x='Vehicle_Type', y='Automobile_Sales', title='Average Vehicles Sold by Vehicle Type in the year {}'.format(input_year)))
+        # Rolling up the aggregate cube for plotting.
+        avr_vdata = rollup(yearly_cube, 'Vehicle_Type', 'Automobile_Sales')
+        Y_chart3 = px.bar(avr_vdata, x='Vehicle_Type', y='Automobile_Sales', title='Average Vehicles Sold by Vehicle Type in the year {}'.format(input_year))
         
         # Plot 4: Total Advertisement Expenditure for each vehicle using pie chart
-        # Grouping data for plotting.
-        exp_data = yearly_data.groupby('Vehicle_Type')['Advertising_Expenditure'].sum().reset_index()
-        Y_chart4 = dcc.Graph(
-            figure=px.pie(exp_data, 
+        # Rolling up the aggregate cube for plotting.
+        exp_data = rollup(yearly_cube, 'Vehicle_Type', 'Advertising_Expenditure', how='sum')
+        Y_chart4 = px.pie(exp_data, 
             values='Advertising_Expenditure',
             names='Vehicle_Type',
-            title='Total Advertisement Expenditure for Each Vehicle'))
+            title='Total Advertisement Expenditure for Each Vehicle')
         
-        return [
-            html.Div(className='chart-item', children=[html.Div(children=Y_chart1), html.Div(children=Y_chart2)], style={'display':'flex'}),
-            html.Div(className='chart-item', children=[html.Div(children=Y_chart3), html.Div(children=Y_chart4)], style={'display': 'flex'})
-        ]
+        figures = (Y_chart1, Y_chart2, Y_chart3, Y_chart4)
     
     else:
         return None
 
+    figures, bytes_before, bytes_after = slim_figures(fig.to_plotly_json() for fig in figures)
+    payload_sizes[(selected_statistics, input_year)] = (bytes_before, bytes_after)
+    return tuple(figures)
+
+
+def warm_figure_cache():
+    """Pre-render every (report type, year) combination into the figure cache"""
+    build_report_figures('Recession Period Statistics', None)
+    for year in year_list:
+        build_report_figures('Yearly Statistics', year)
+    return build_report_figures.cache_info()
+
+
+# Update Output Container callback function
+@app.callback(
+    Output(component_id='output-container', component_property='children'),
+    [Input(component_id='dropdown-statistics', component_property='value'), 
+     Input(component_id='select-year', component_property='value')])
+def update_output_container(selected_statistics, input_year):
+    key = report_cache_key(selected_statistics, input_year)
+    if key is None:
+        return None
+
+    charts = [dcc.Graph(figure=fig) for fig in build_report_figures(*key)]
+    record_payload('update_output_container', *payload_sizes[key])
+    # Two charts per row
+    return [
+        html.Div(className='chart-item', children=[html.Div(children=chart) for chart in charts[i:i + 2]], style={'display': 'flex'})
+        for i in range(0, len(charts), 2)
+    ]
+
+
+# Payload bytes per callback, before and after figure slimming
+register_metrics_route(app.server)
+
+# Set DASHBOARD_WARM_CACHE=1 to pre-render all reports at startup
+if os.environ.get('DASHBOARD_WARM_CACHE') == '1':
+    warm_figure_cache()
+
 # Run the app
 if __name__ == '__main__':
     app.run(debug=True, port=8050)
\ No newline at end of file
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Headless Benchmark for the Automobile Sales Dashboard
+Times the dashboard callbacks without a browser
+
+The Dash app is started in-process and every report/year combination is sent
+through Dash's own callback dispatch endpoint (/_dash-update-component) with
+the Flask test client. Reports p50/p95/p99 latency, response payload bytes and
+peak memory for update_output_container (update_input_container runs clientside
+in the browser and never reaches the server).
+"""
+
+import argparse
+import json
+import resource
+import time
+import tracemalloc
+
+import numpy as np
+
+import automobile_sales_dashboard as dashboard
+
+REPORT_TYPES = ['Yearly Statistics', 'Recession Period Statistics']
+
+
+def callback_body(output_id, output_property, inputs, changed):
+    """Build the JSON body the Dash renderer posts for one callback"""
+    return {
+        'output': '{}.{}'.format(output_id, output_property),
+        'outputs': {'id': output_id, 'property': output_property},
+        'inputs': [{'id': component_id, 'property': 'value', 'value': value}
+                   for component_id, value in inputs],
+        'changedPropIds': ['{}.value'.format(changed)],
+        'state': []
+    }
+
+
+def callback_requests():
+    """All (callback name, request body) pairs for every report/year combination"""
+    requests = []
+    for report in REPORT_TYPES:
+        for year in dashboard.year_list:
+            requests.append(('update_output_container', callback_body(
+                'output-container', 'children',
+                [('dropdown-statistics', report), ('select-year', year)], 'select-year')))
+    return requests
+
+
+def dispatch(client, body):
+    """Send one callback through Dash's dispatch endpoint, returning the response size in bytes"""
+    response = client.post('/_dash-update-component', data=json.dumps(body),
+                           content_type='application/json')
+    if response.status_code not in (200, 204):
+        raise RuntimeError('Callback failed with HTTP {}: {}'.format(response.status_code, response.data[:200]))
+    return len(response.data)
+
+
+def run_pass(client, requests):
+    """Dispatch every request once, collecting latency (ms) and payload bytes per callback"""
+    results = {}
+    for name, body in requests:
+        start = time.perf_counter()
+        size = dispatch(client, body)
+        elapsed = (time.perf_counter() - start) * 1000
+        latencies, sizes = results.setdefault(name, ([], []))
+        latencies.append(elapsed)
+        sizes.append(size)
+    return results
+
+
+def summarize(phase, results):
+    """Print latency percentiles and payload sizes per callback"""
+    for name, (latencies, sizes) in results.items():
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        print(f"{phase:6} {name:24} n={len(latencies):4}  p50={p50:8.2f}ms  p95={p95:8.2f}ms  "
+              f"p99={p99:8.2f}ms  payload={np.mean(sizes) / 1024:8.1f}KB (max {max(sizes) / 1024:.1f}KB)")
+
+
+def run(repeat=5):
+    """Benchmark cold (empty figure cache) and warm callback latency"""
+    client = dashboard.app.server.test_client()
+    requests = callback_requests()
+    # Load the layout once so Dash finishes its server setup
+    client.get('/')
+
+    # Cold pass: figure cache cleared
+    dashboard.build_report_figures.cache_clear()
+    cold = run_pass(client, requests)
+
+    # Warm passes: repeat selections served from the figure cache
+    warm = {}
+    for _ in range(repeat):
+        for name, (latencies, sizes) in run_pass(client, requests).items():
+            warm.setdefault(name, ([], []))
+            warm[name][0].extend(latencies)
+            warm[name][1].extend(sizes)
+
+    # Separate cold pass for peak Python memory, tracing would skew the latencies
+    dashboard.build_report_figures.cache_clear()
+    tracemalloc.start()
+    run_pass(client, requests)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print("🎯 Dashboard callback benchmark")
+    print("="*60)
+    print(f"Dataset rows: {len(dashboard.data):,}")
+    summarize('cold', cold)
+    summarize('warm', warm)
+    print(f"Peak traced memory (cold pass): {peak / 1e6:.1f} MB")
+    print(f"Max RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB")
+    print(f"Figure cache: {dashboard.build_report_figures.cache_info()}")
+    return cold, warm, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the dashboard callbacks headlessly')
+    parser.add_argument('--repeat', type=int, default=5, help='warm passes over all combinations')
+    args = parser.parse_args()
+    run(repeat=args.repeat)
+
+if __name__ == "__main__":
+    main()
@@ -41,8 +41,10 @@ html.Div([
     html.Div(id='output-container', className='chart-grid', style={'display': 'flex'}),
 ])"""
 
-create_code_screenshot("Task 2.3: Output Division with ID and ClassName", 
-                      task_2_3_code, "outputdiv.png")
+def create_outputdiv_screenshot():
+    """Task 2.3: Output division code screenshot"""
+    create_code_screenshot("Task 2.3: Output Division with ID and ClassName", 
+                          task_2_3_code, "outputdiv.png")
 
 # Task 2.4: Callbacks
 task_2_4_code = """# TASK 2.4: Creating Callbacks
@@ -66,10 +68,19 @@ def update_output_container(selected_statistics, input_year):
     # Callback implementation here
     pass"""
 
-create_code_screenshot("Task 2.4: Callback Functions for Interactivity", 
-                      task_2_4_code, "Callbacks.png", figsize=(14, 10))
+def create_callbacks_screenshot():
+    """Task 2.4: Callback functions code screenshot"""
+    create_code_screenshot("Task 2.4: Callback Functions for Interactivity", 
+                          task_2_4_code, "Callbacks.png", figsize=(14, 10))
 
-print("\n🎯 Code screenshot files created successfully!")
-print("📁 Files created:")
-print("   • outputdiv.png")
-print("   • Callbacks.png")
\ No newline at end of file
+def main():
+    create_outputdiv_screenshot()
+    create_callbacks_screenshot()
+
+    print("\n🎯 Code screenshot files created successfully!")
+    print("📁 Files created:")
+    print("   • outputdiv.png")
+    print("   • Callbacks.png")
+
+if __name__ == "__main__":
+    main()
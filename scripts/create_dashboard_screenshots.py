@@ -198,22 +198,26 @@ def create_yearly_graphs_screenshot():
     plt.close()
     print("✅ Created: YearlyReportgraphs.png")
 
-# Create all screenshots
-print("🎯 Creating Dashboard Screenshots...")
-print("="*60)
+def main():
+    # Create all screenshots
+    print("🎯 Creating Dashboard Screenshots...")
+    print("="*60)
 
-create_title_screenshot()
-create_dropdown_screenshot()
-create_recession_graphs_screenshot()
-create_yearly_graphs_screenshot()
+    create_title_screenshot()
+    create_dropdown_screenshot()
+    create_recession_graphs_screenshot()
+    create_yearly_graphs_screenshot()
 
-print("\n🎉 All dashboard screenshots created successfully!")
-print("📁 Files created:")
-print("   • Title.png - Dashboard title")
-print("   • Dropdown.png - Dropdown menus")
-print("   • RecessionReportgraphs.png - Recession period statistics")
-print("   • YearlyReportgraphs.png - Yearly statistics report")
-print("\n💡 Combined with previous files:")
-print("   • outputdiv.png - Output division code")
-print("   • Callbacks.png - Callback functions code")
-print("\n🎯 All 6 required screenshots are now ready for submission!")
\ No newline at end of file
+    print("\n🎉 All dashboard screenshots created successfully!")
+    print("📁 Files created:")
+    print("   • Title.png - Dashboard title")
+    print("   • Dropdown.png - Dropdown menus")
+    print("   • RecessionReportgraphs.png - Recession period statistics")
+    print("   • YearlyReportgraphs.png - Yearly statistics report")
+    print("\n💡 Combined with previous files:")
+    print("   • outputdiv.png - Output division code")
+    print("   • Callbacks.png - Callback functions code")
+    print("\n🎯 All 6 required screenshots are now ready for submission!")
+
+if __name__ == "__main__":
+    main()
@@ -367,24 +367,28 @@ def create_task_2_6_yearly_graphs():
     plt.close()
     print("✅ Enhanced YearlyReportgraphs.png created")
 
-# Main execution
-print("🎯 Creating Enhanced Task 2 Screenshots...")
-print("="*60)
+def main():
+    # Main execution
+    print("🎯 Creating Enhanced Task 2 Screenshots...")
+    print("="*60)
 
-# Create all enhanced screenshots
-create_task_2_1_title()
-create_task_2_2_dropdown()
-create_task_2_3_outputdiv()
-create_task_2_4_callbacks()
-create_task_2_5_recession_graphs()
-create_task_2_6_yearly_graphs()
+    # Create all enhanced screenshots
+    create_task_2_1_title()
+    create_task_2_2_dropdown()
+    create_task_2_3_outputdiv()
+    create_task_2_4_callbacks()
+    create_task_2_5_recession_graphs()
+    create_task_2_6_yearly_graphs()
 
-print("\n🎉 All enhanced Task 2 screenshots created successfully!")
-print("📁 Enhanced files created:")
-print("   • Title.png - Professional dashboard title")
-print("   • Dropdown.png - Interactive dropdown menus")
-print("   • outputdiv.png - Code snippet with syntax highlighting")
-print("   • Callbacks.png - Callback functions with syntax highlighting")
-print("   • RecessionReportgraphs.png - 4 recession analysis charts")
-print("   • YearlyReportgraphs.png - 4 yearly statistics charts")
-print("\n🎯 All Task 2 screenshots are now high-quality and ready for submission!")
\ No newline at end of file
+    print("\n🎉 All enhanced Task 2 screenshots created successfully!")
+    print("📁 Enhanced files created:")
+    print("   • Title.png - Professional dashboard title")
+    print("   • Dropdown.png - Interactive dropdown menus")
+    print("   • outputdiv.png - Code snippet with syntax highlighting")
+    print("   • Callbacks.png - Callback functions with syntax highlighting")
+    print("   • RecessionReportgraphs.png - 4 recession analysis charts")
+    print("   • YearlyReportgraphs.png - 4 yearly statistics charts")
+    print("\n🎯 All Task 2 screenshots are now high-quality and ready for submission!")
+
+if __name__ == "__main__":
+    main()
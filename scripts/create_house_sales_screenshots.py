@@ -526,46 +526,50 @@ def create_question_10_screenshot():
     plt.close()
     print("✅ Question 10 screenshot created")
 
-# Main execution
-print("🎯 Creating House Sales Assignment Screenshots...")
-print("="*60)
+def main():
+    # Main execution
+    print("🎯 Creating House Sales Assignment Screenshots...")
+    print("="*60)
 
-# Create screenshots for all 10 questions
-create_question_1_screenshot()
-create_question_2_screenshot()
-create_question_3_screenshot()
-create_question_4_screenshot()
-create_question_5_screenshot()
-create_question_6_screenshot()
-create_question_7_screenshot()
-create_question_8_screenshot()
-create_question_9_screenshot()
-create_question_10_screenshot()
+    # Create screenshots for all 10 questions
+    create_question_1_screenshot()
+    create_question_2_screenshot()
+    create_question_3_screenshot()
+    create_question_4_screenshot()
+    create_question_5_screenshot()
+    create_question_6_screenshot()
+    create_question_7_screenshot()
+    create_question_8_screenshot()
+    create_question_9_screenshot()
+    create_question_10_screenshot()
 
-print("\n🎉 All 10 assignment screenshots created successfully!")
-print("📁 Files created:")
-for i in range(1, 11):
-    if i == 1:
-        filename = "Question_1_Data_Types.png"
-    elif i == 2:
-        filename = "Question_2_Drop_Describe.png"
-    elif i == 3:
-        filename = "Question_3_Floor_Counts.png"
-    elif i == 4:
-        filename = "Question_4_Waterfront_Boxplot.png"
-    elif i == 5:
-        filename = "Question_5_Regression_Plot.png"
-    elif i == 6:
-        filename = "Question_6_Linear_Regression.png"
-    elif i == 7:
-        filename = "Question_7_Multiple_Features.png"
-    elif i == 8:
-        filename = "Question_8_Pipeline.png"
-    elif i == 9:
-        filename = "Question_9_Ridge_Regression.png"
-    else:
-        filename = "Question_10_Ridge_Polynomial.png"
-    
-    print(f"   • {filename}")
+    print("\n🎉 All 10 assignment screenshots created successfully!")
+    print("📁 Files created:")
+    for i in range(1, 11):
+        if i == 1:
+            filename = "Question_1_Data_Types.png"
+        elif i == 2:
+            filename = "Question_2_Drop_Describe.png"
+        elif i == 3:
+            filename = "Question_3_Floor_Counts.png"
+        elif i == 4:
+            filename = "Question_4_Waterfront_Boxplot.png"
+        elif i == 5:
+            filename = "Question_5_Regression_Plot.png"
+        elif i == 6:
+            filename = "Question_6_Linear_Regression.png"
+        elif i == 7:
+            filename = "Question_7_Multiple_Features.png"
+        elif i == 8:
+            filename = "Question_8_Pipeline.png"
+        elif i == 9:
+            filename = "Question_9_Ridge_Regression.png"
+        else:
+            filename = "Question_10_Ridge_Polynomial.png"
 
-print("\n🎯 All screenshots are ready for submission!")
\ No newline at end of file
+        print(f"   • {filename}")
+
+    print("\n🎯 All screenshots are ready for submission!")
+
+if __name__ == "__main__":
+    main()
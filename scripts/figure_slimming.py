@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Figure Slimming for the Dash Dashboards
+Server-side post-processing of plotly figures before they are sent
+
+Applied to the figure dicts (fig.to_plotly_json()) of the automobile sales
+dashboard and the airline dashboard:
+- long line/scatter series are downsampled with LTTB (Largest Triangle Three Buckets)
+- bar traces over a high-cardinality numeric x axis are binned to equal-width bins
+- line/scatter traces still above a point threshold switch to WebGL (scattergl)
+- template defaults for trace types the figure does not use are stripped
+
+Payload bytes before and after slimming are recorded per callback and can be
+served as JSON with register_metrics_route().
+"""
+
+import base64
+import json
+import os
+import threading
+
+import numpy as np
+from plotly.utils import PlotlyJSONEncoder
+
+SLIM_FIGURES = os.environ.get('FIGURE_SLIMMING', '1') == '1'
+MAX_POINTS = int(os.environ.get('FIGURE_MAX_POINTS', 2000))
+WEBGL_THRESHOLD = int(os.environ.get('FIGURE_WEBGL_THRESHOLD', 1000))
+MAX_BINS = int(os.environ.get('FIGURE_MAX_BINS', 50))
+
+# Per-point trace attributes kept aligned when points are dropped
+POINT_KEYS = ['x', 'y', 'customdata', 'text', 'hovertext', 'ids']
+
+# Callback name -> payload counters, see record_payload()
+payload_metrics = {}
+metrics_lock = threading.Lock()
+
+
+def decode_array(value):
+    """Trace data as a 1-D numpy array (lists, arrays or plotly typed-array dicts), else None"""
+    if isinstance(value, dict) and 'bdata' in value:
+        if 'shape' in value and ',' in str(value['shape']):
+            return None
+        return np.frombuffer(base64.b64decode(value['bdata']), dtype=np.dtype(value['dtype']))
+    if isinstance(value, (list, tuple, np.ndarray)):
+        array = np.asarray(value)
+        return array if array.ndim == 1 else None
+    return None
+
+
+def is_numeric(array):
+    return array is not None and array.dtype.kind in 'iuf'
+
+
+def lttb_indices(x, y, n_out):
+    """Indices of the points kept by Largest Triangle Three Buckets downsampling
+
+    The first and last points are kept; every bucket in between keeps the
+    point forming the largest triangle with the previous kept point and the
+    mean of the next bucket, which preserves peaks and troughs.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        mean_x, mean_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        area = np.abs((x[previous] - mean_x) * (y[start:end] - y[previous])
+                      - (x[previous] - x[start:end]) * (mean_y - y[previous]))
+        previous = start + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        selected[i + 1] = previous
+    return selected
+
+
+def take_points(trace, indices, n):
+    """Copy of a trace keeping only the given points of every per-point attribute"""
+    trace = dict(trace)
+    for key in POINT_KEYS:
+        array = decode_array(trace.get(key))
+        if array is not None and len(array) == n:
+            trace[key] = array[indices]
+    marker = trace.get('marker')
+    if isinstance(marker, dict):
+        marker = dict(marker)
+        for key in ('color', 'size', 'symbol'):
+            array = decode_array(marker.get(key))
+            if array is not None and len(array) == n:
+                marker[key] = array[indices]
+        trace['marker'] = marker
+    return trace
+
+
+def slim_scatter(trace, max_points=MAX_POINTS, webgl_threshold=WEBGL_THRESHOLD):
+    """Downsample a long line/scatter trace and switch it to WebGL when still large"""
+    y = decode_array(trace.get('y'))
+    if not is_numeric(y):
+        return trace
+    x = decode_array(trace.get('x'))
+    n = len(y)
+    if n > max_points:
+        # Non-numeric x (dates, categories): downsample on point position
+        position = x.astype(np.float64) if is_numeric(x) and len(x) == n else np.arange(n, dtype=np.float64)
+        trace = take_points(trace, lttb_indices(position, y.astype(np.float64), max_points), n)
+        n = max_points
+    if n > webgl_threshold and trace.get('type', 'scatter') == 'scatter':
+        trace = dict(trace, type='scattergl')
+    return trace
+
+
+def bar_bin_edges(traces, max_bins=MAX_BINS):
+    """Shared equal-width bin edges for bar traces with too many distinct numeric x values
+
+    One set of edges for all bar traces keeps stacked/grouped bars aligned.
+    Returns None when no trace needs binning.
+    """
+    xs = [decode_array(trace.get('x')) for trace in traces if trace.get('type') == 'bar']
+    xs = [x for x in xs if is_numeric(x) and len(x)]
+    if not xs or max(len(np.unique(x)) for x in xs) <= max_bins:
+        return None
+    values = np.concatenate(xs).astype(np.float64)
+    low, high = np.nanmin(values), np.nanmax(values)
+    if high <= low:
+        return None
+    return np.linspace(low, high, max_bins + 1)
+
+
+def bin_bar(trace, edges):
+    """Replace a bar trace's points with the mean y per x bin, drawn at the bin centers"""
+    x, y = decode_array(trace.get('x')), decode_array(trace.get('y'))
+    if not (is_numeric(x) and is_numeric(y)) or len(x) != len(y):
+        return trace
+    bins = np.clip(np.digitize(x, edges) - 1, 0, len(edges) - 2)
+    counts = np.bincount(bins, minlength=len(edges) - 1)
+    sums = np.bincount(bins, weights=y.astype(np.float64), minlength=len(edges) - 1)
+    filled = counts > 0
+    trace = {key: value for key, value in trace.items() if key not in POINT_KEYS}
+    trace.update(x=((edges[:-1] + edges[1:]) / 2)[filled], y=sums[filled] / counts[filled],
+                 width=float(edges[1] - edges[0]))
+    return trace
+
+
+def strip_template(layout, trace_types):
+    """Drop template trace defaults for trace types the figure does not contain"""
+    template = layout.get('template')
+    if not isinstance(template, dict) or not isinstance(template.get('data'), dict):
+        return layout
+    data = {trace_type: defaults for trace_type, defaults in template['data'].items()
+            if trace_type in trace_types}
+    return dict(layout, template=dict(template, data=data))
+
+
+def slim_figure(figure, max_points=MAX_POINTS, webgl_threshold=WEBGL_THRESHOLD, max_bins=MAX_BINS):
+    """Return a slimmed copy of a plotly figure dict
+
+    Arguments:
+        figure: Figure as a dict, e.g. fig.to_plotly_json().
+        max_points: Largest number of points kept per line/scatter trace.
+        webgl_threshold: Line/scatter traces with more points are drawn with scattergl.
+        max_bins: Bar traces with more distinct numeric x values are binned to this many bins.
+
+    Returns:
+        Figure dict with new 'data' and 'layout'; the input is not modified.
+    """
+    traces = list(figure.get('data', []))
+    edges = bar_bin_edges(traces, max_bins)
+    slimmed = []
+    for trace in traces:
+        trace_type = trace.get('type', 'scatter')
+        if trace_type in ('scatter', 'scattergl'):
+            trace = slim_scatter(trace, max_points, webgl_threshold)
+        elif trace_type == 'bar' and edges is not None:
+            trace = bin_bar(trace, edges)
+        slimmed.append(trace)
+    trace_types = {trace.get('type', 'scatter') for trace in slimmed}
+    return dict(figure, data=slimmed, layout=strip_template(figure.get('layout', {}), trace_types))
+
+
+def figure_bytes(figures):
+    """Size of the figures serialized the way Dash sends them"""
+    return len(json.dumps(figures, cls=PlotlyJSONEncoder))
+
+
+def slim_figures(figures):
+    """Slim a list of figure dicts (unless FIGURE_SLIMMING=0)
+
+    Returns:
+        Tuple of (figure dicts, payload bytes before, payload bytes after).
+    """
+    figures = list(figures)
+    before = figure_bytes(figures)
+    if SLIM_FIGURES:
+        figures = [slim_figure(figure) for figure in figures]
+    return figures, before, figure_bytes(figures)
+
+
+def record_payload(callback, bytes_before, bytes_after):
+    """Count one response of a callback and its payload size before/after slimming"""
+    with metrics_lock:
+        entry = payload_metrics.setdefault(callback, {'calls': 0, 'bytes_before': 0, 'bytes_after': 0,
+                                                      'max_bytes_after': 0})
+        entry['calls'] += 1
+        entry['bytes_before'] += bytes_before
+        entry['bytes_after'] += bytes_after
+        entry['max_bytes_after'] = max(entry['max_bytes_after'], bytes_after)
+
+
+def payload_report():
+    """Mean payload bytes before/after slimming per callback"""
+    with metrics_lock:
+        return {callback: {'calls': entry['calls'],
+                           'mean_bytes_before': entry['bytes_before'] / entry['calls'],
+                           'mean_bytes_after': entry['bytes_after'] / entry['calls'],
+                           'max_bytes_after': entry['max_bytes_after'],
+                           'reduction': 1 - entry['bytes_after'] / max(entry['bytes_before'], 1)}
+                for callback, entry in payload_metrics.items()}
+
+
+def register_metrics_route(server, path='/_payload-metrics'):
+    """Serve payload_report() as JSON from the app's Flask server"""
+    from flask import jsonify
+
+    server.add_url_rule(path, 'payload_metrics', lambda: jsonify(payload_report()))
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+House Sales Cleaning Stage
+Reusable NaN imputation for kc_house_data_NaN.csv
+
+The dataset has missing values in 'bedrooms' and 'bathrooms'. Instead of
+dropping different rows per question, the fill values are fitted once
+(mean, median or median per zipcode), recorded so the identical transform
+can be applied at scoring time, and applied to all columns in one
+vectorized pass. The cleaned frame is cached per strategy.
+"""
+
+import functools
+import json
+
+import numpy as np
+import pandas as pd
+
+from house_sales_data import load_house_data
+
+IMPUTE_COLUMNS = ['bedrooms', 'bathrooms']
+STRATEGIES = ['mean', 'median', 'zipcode_median']
+GROUP_COLUMN = 'zipcode'
+
+
+def fit_imputer(df, strategy='zipcode_median', columns=IMPUTE_COLUMNS):
+    """Compute the fill values for the given columns
+
+    Arguments:
+        df: House sales dataframe.
+        strategy: 'mean', 'median' or 'zipcode_median' (median within the
+            listing's zipcode, global median for zipcodes with no value).
+        columns: Columns to impute.
+
+    Returns:
+        JSON-serializable dictionary of fill values.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError('Unknown strategy {!r}, expected one of {}'.format(strategy, STRATEGIES))
+    columns = list(columns)
+    values = df[columns].astype(np.float64)
+    imputer = {'strategy': strategy, 'columns': columns}
+    if strategy == 'mean':
+        imputer['fill'] = values.mean().to_dict()
+    else:
+        imputer['fill'] = values.median().to_dict()
+    if strategy == 'zipcode_median':
+        # One groupby pass for all columns; groups with no value stay NaN and use the global fill
+        medians = values.groupby(df[GROUP_COLUMN].to_numpy()).median()
+        imputer['groups'] = [int(zipcode) for zipcode in medians.index]
+        imputer['group_fill'] = {column: medians[column].tolist() for column in columns}
+    return imputer
+
+
+def apply_imputer(df, imputer):
+    """Fill missing values with recorded fill values, returning a new frame
+
+    Columns that are not imputed are shared with the input frame, not copied.
+    """
+    filled = {}
+    if imputer['strategy'] == 'zipcode_median':
+        # Position of each listing's zipcode in the fitted groups (-1 when unseen)
+        groups = pd.Index(imputer['groups'])
+        positions = groups.get_indexer(df[GROUP_COLUMN].to_numpy())
+    for column in imputer['columns']:
+        values = df[column].to_numpy(dtype=np.float64)
+        fill = np.full(len(values), imputer['fill'][column])
+        if imputer['strategy'] == 'zipcode_median':
+            group_fill = np.append(np.asarray(imputer['group_fill'][column], dtype=np.float64), np.nan)
+            by_group = group_fill[positions]
+            fill = np.where(np.isnan(by_group), fill, by_group)
+        filled[column] = np.where(np.isnan(values), fill, values)
+    return df.assign(**filled)
+
+
+def save_imputer(imputer, path):
+    """Write recorded fill values as JSON"""
+    with open(path, 'w') as f:
+        json.dump(imputer, f, indent=2)
+
+
+def load_imputer(path):
+    """Read fill values written by save_imputer()"""
+    with open(path) as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=len(STRATEGIES))
+def load_clean_house_data(strategy='zipcode_median'):
+    """Load the dataset through the columnar cache and impute it, cached per strategy
+
+    Returns:
+        Tuple of (cleaned dataframe, imputer). The frame is shared between
+        callers; with pandas copy-on-write, modifications stay local to the caller.
+    """
+    df = load_house_data()
+    imputer = fit_imputer(df, strategy)
+    return apply_imputer(df, imputer), imputer
+
+
+if __name__ == '__main__':
+    raw = load_house_data()
+    for strategy in STRATEGIES:
+        clean, imputer = load_clean_house_data(strategy)
+        print(f"📊 {strategy:15} missing before: {int(raw[IMPUTE_COLUMNS].isna().sum().sum()):3}  "
+              f"after: {int(clean[IMPUTE_COLUMNS].isna().sum().sum())}  "
+              f"global fill: {', '.join(f'{c}={v:.3f}' for c, v in imputer['fill'].items())}")
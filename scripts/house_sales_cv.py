@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+House Sales K-Fold Model Comparison
+Parallel cross-validation of the five notebook models
+
+Evaluates the single-feature OLS, 11-feature OLS, scaled polynomial pipeline,
+Ridge and Ridge + polynomial models under k-fold CV. Every (model, fold) pair
+runs in a process pool; X and y are published once in shared memory and each
+worker attaches to them, so the data is never pickled per task.
+"""
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression, Ridge
+from sklearn.metrics import r2_score
+from sklearn.model_selection import KFold
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import PolynomialFeatures, StandardScaler
+
+from house_sales_regression import FEATURES, TARGET
+
+
+def linear_regression():
+    """Questions 6 and 7: ordinary least squares"""
+    return LinearRegression()
+
+
+def scaled_polynomial_pipeline():
+    """Question 8: StandardScaler -> PolynomialFeatures(2) -> LinearRegression"""
+    return Pipeline([('scaler', StandardScaler()), ('poly', PolynomialFeatures(degree=2)),
+                     ('regressor', LinearRegression())])
+
+
+def ridge():
+    """Question 9: Ridge with alpha 0.1"""
+    return Ridge(alpha=0.1)
+
+
+def ridge_polynomial():
+    """Question 10: PolynomialFeatures(2) -> Ridge with alpha 0.1"""
+    return Pipeline([('poly', PolynomialFeatures(degree=2)), ('regressor', Ridge(alpha=0.1))])
+
+
+# Model name -> (feature columns, estimator factory), in notebook question order
+MODELS = {
+    'Single feature (sqft_living)': (['sqft_living'], linear_regression),
+    'Multiple features (11)': (FEATURES, linear_regression),
+    'Pipeline (scaled + polynomial)': (FEATURES, scaled_polynomial_pipeline),
+    'Ridge regression': (FEATURES, ridge),
+    'Ridge + Polynomial': (FEATURES, ridge_polynomial),
+}
+
+# Worker-side views of the shared arrays, set by attach_shared_data()
+shared = {}
+
+
+def publish_array(array):
+    """Copy an array into a new shared memory block, returning the block and its descriptor"""
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+
+def attach_shared_data(x_descriptor, y_descriptor):
+    """Worker initializer: map X and y from shared memory without copying"""
+    for key, (name, shape, dtype) in (('X', x_descriptor), ('y', y_descriptor)):
+        # Keep a reference to the block so the buffer stays mapped
+        shared[key + '_block'] = block = shared_memory.SharedMemory(name=name)
+        shared[key] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+
+def evaluate_fold(model_name, fold, n_splits, seed):
+    """Worker: fit one model on one fold and score it on the held-out rows"""
+    X, y = shared['X'], shared['y']
+    train_idx, test_idx = list(KFold(n_splits, shuffle=True, random_state=seed).split(X))[fold]
+    columns, factory = MODELS[model_name]
+    cols = [FEATURES.index(column) for column in columns]
+
+    start = time.perf_counter()
+    model = factory().fit(X[np.ix_(train_idx, cols)], y[train_idx])
+    fit_time = time.perf_counter() - start
+    start = time.perf_counter()
+    r2 = r2_score(y[test_idx], model.predict(X[np.ix_(test_idx, cols)]))
+    predict_time = time.perf_counter() - start
+    return {'model': model_name, 'fold': fold, 'r2': r2, 'fit_s': fit_time, 'predict_s': predict_time}
+
+
+def cross_validate(X, y, n_splits=5, seed=42, workers=None):
+    """Run k-fold CV for every model in a process pool backed by shared memory
+
+    Arguments:
+        X: Feature matrix with the FEATURES columns.
+        y: Target vector.
+        n_splits: Number of folds.
+        seed: KFold shuffle seed.
+        workers: Worker processes (default: CPU count).
+
+    Returns:
+        Tuple of (per-fold results dataframe, comparison table).
+    """
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    x_block, x_descriptor = publish_array(X)
+    y_block, y_descriptor = publish_array(y)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=attach_shared_data,
+                                 initargs=(x_descriptor, y_descriptor)) as pool:
+            futures = [pool.submit(evaluate_fold, name, fold, n_splits, seed)
+                       for name in MODELS for fold in range(n_splits)]
+            folds = pd.DataFrame([future.result() for future in futures])
+    finally:
+        for block in (x_block, y_block):
+            block.close()
+            block.unlink()
+
+    table = folds.groupby('model', sort=False).agg(
+        r2_mean=('r2', 'mean'), r2_std=('r2', 'std'),
+        fit_s_mean=('fit_s', 'mean'), predict_s_mean=('predict_s', 'mean'))
+    return folds, table
+
+
+def main():
+    from house_sales_data import load_house_data
+
+    parser = argparse.ArgumentParser(description='K-fold comparison of the house sales models')
+    parser.add_argument('--folds', type=int, default=5, help='number of folds')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    complete = load_house_data()[FEATURES + [TARGET]].dropna()
+    start = time.perf_counter()
+    folds, table = cross_validate(complete[FEATURES].to_numpy(np.float64),
+                                  complete[TARGET].to_numpy(np.float64),
+                                  n_splits=args.folds, workers=args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"🎯 {args.folds}-fold cross-validation ({len(complete)} samples, {elapsed:.2f}s)")
+    print("="*60)
+    print(table.to_string(float_format=lambda v: f"{v:.4f}"))
+    print("\nPer-fold timings:")
+    print(folds.pivot(index='model', columns='fold', values='fit_s')
+          .loc[list(MODELS)].to_string(float_format=lambda v: f"{v:.4f}"))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+King County House Sales Data Loader
+Columnar on-disk cache for data/kc_house_data_NaN.csv
+
+The CSV is parsed once into a bundle of typed .npy column files (the
+pd.read_csv dtypes, pre-parsed dates), written and memory-mapped with
+shared_frames.publish_frames()/attach_frames(). Later loads memory-map the
+bundle instead of re-parsing the CSV. The cache is rebuilt when the source
+file changes. Compact dtypes are opt-in (compact=True, see house_sales_schema.py):
+small unsigned integers wrap around in arithmetic such as
+yr_renovated - yr_built, so the default frame keeps int64/float64.
+"""
+
+import hashlib
+import os
+import time
+
+import pandas as pd
+
+from shared_frames import MANIFEST_VERSION, attach_frames, publish_frames, read_manifest, write_manifest
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'kc_house_data_NaN.csv')
+DATE_FORMAT = '%Y%m%dT%H%M%S'
+# 2: columns keep the pd.read_csv dtypes instead of being downcast
+# 3: bundle written by shared_frames.publish_frames (manifest.json)
+CACHE_VERSION = 3
+
+
+def default_cache_dir(path):
+    """Cache bundle location: data/.cache/<csv name>/ next to the source file"""
+    directory, filename = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, '.cache', os.path.splitext(filename)[0])
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """Hash the source file in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parse_csv(path):
+    """Parse the raw CSV into a typed frame (dates parsed, numeric dtypes as pd.read_csv gives them)"""
+    df = pd.read_csv(path)
+    df['date'] = pd.to_datetime(df['date'], format=DATE_FORMAT)
+    return df
+
+
+def source_signature(path):
+    """Cheap change detection: source mtime and size"""
+    stat = os.stat(path)
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def cache_is_valid(path, cache_dir, manifest):
+    """Check the bundle against the source (mtime/size first, content hash as fallback)"""
+    if manifest is None or manifest.get('version') != MANIFEST_VERSION:
+        return False
+    key = manifest.get('key') or {}
+    if key.get('version') != CACHE_VERSION:
+        return False
+    signature = source_signature(path)
+    if key['source'] == signature:
+        return True
+    if key['source']['size'] != signature['size']:
+        return False
+    # Touched but possibly unchanged (e.g. git checkout): compare content hashes
+    if file_sha256(path) != key['sha256']:
+        return False
+    key['source'] = signature
+    write_manifest(cache_dir, manifest)
+    return True
+
+
+def build_cache(path, cache_dir):
+    """Parse the CSV and publish one .npy file per column plus the manifest
+
+    Files are replaced atomically, so processes still mapping the previous
+    bundle keep reading intact data.
+
+    Returns:
+        The manifest of the new bundle.
+    """
+    key = {'version': CACHE_VERSION, 'source': source_signature(path), 'sha256': file_sha256(path)}
+    manifest = publish_frames({'data': parse_csv(path)}, cache_dir, key)
+    # Bundles before version 3 used meta.json and col_*.npy files
+    for name in os.listdir(cache_dir):
+        if name == 'meta.json' or (name.startswith('col_') and name.endswith('.npy')):
+            os.remove(os.path.join(cache_dir, name))
+    return manifest
+
+
+def load_house_data(path=DATA_PATH, cache_dir=None, refresh=False, mmap=True, compact=False):
+    """Load the King County dataset through the columnar cache
+
+    Arguments:
+        path: Source CSV file.
+        cache_dir: Bundle directory, defaults to data/.cache/<csv name>/.
+        refresh: Force a rebuild of the bundle.
+        mmap: Memory-map the cached columns (read-only) instead of reading them.
+        compact: Validate and cast to the compact house_sales_schema dtypes
+            (an in-memory copy; unsigned integers wrap around in arithmetic).
+
+    Returns:
+        DataFrame with the same columns and numeric dtypes as pd.read_csv(path),
+        'date' parsed to datetime64.
+    """
+    cache_dir = cache_dir or default_cache_dir(path)
+    manifest = None if refresh else read_manifest(cache_dir)
+    if not cache_is_valid(path, cache_dir, manifest):
+        manifest = build_cache(path, cache_dir)
+    df = attach_frames(cache_dir, manifest, mmap=mmap)['data']
+    if compact:
+        # Imported here: house_sales_schema imports DATE_FORMAT from this module
+        from house_sales_schema import apply_schema
+
+        df = apply_schema(df)
+    return df
+
+
+if __name__ == '__main__':
+    start = time.perf_counter()
+    pd.read_csv(DATA_PATH)
+    csv_time = time.perf_counter() - start
+
+    load_house_data()
+    start = time.perf_counter()
+    df = load_house_data()
+    cached_time = time.perf_counter() - start
+
+    print(f"📊 Loaded {df.shape[0]} rows x {df.shape[1]} columns")
+    print(f"   • pd.read_csv:   {csv_time * 1000:8.2f} ms")
+    print(f"   • columnar cache: {cached_time * 1000:8.2f} ms")
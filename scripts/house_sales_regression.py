@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+House Sales Regression from Sufficient Statistics
+Closed-form OLS / Ridge for the King County models
+
+The data is scanned once to compute the count, means and centered
+cross-product matrix of [X, y]. Any feature subset can then be solved as OLS
+or Ridge at any alpha, and scored (R²) on any other set of statistics, with
+small p x p linear algebra instead of refitting on the rows.
+"""
+
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# Question 7 feature list
+FEATURES = ["floors", "waterfront", "lat", "bedrooms", "sqft_basement",
+            "view", "bathrooms", "sqft_living15", "sqft_above", "grade", "sqft_living"]
+TARGET = 'price'
+
+# columns: feature names followed by the target
+# n: number of rows
+# mean: column means of [X, y]
+# comoment: centered cross-product matrix of [X, y], i.e. (Z - mean)'(Z - mean)
+SufficientStats = namedtuple('SufficientStats', ['columns', 'n', 'mean', 'comoment'])
+
+# intercept and coef follow sklearn's LinearRegression / Ridge attributes
+LinearModel = namedtuple('LinearModel', ['features', 'alpha', 'intercept', 'coef'])
+
+# Rows per block when accumulating polynomial statistics
+BLOCK_SIZE = 8192
+
+
+def stats_from_arrays(X, y, columns):
+    """Compute sufficient statistics from a feature matrix and target vector"""
+    Z = np.column_stack([np.asarray(X, dtype=np.float64), np.asarray(y, dtype=np.float64)])
+    mean = Z.mean(axis=0)
+    # Centering before the product avoids cancellation with large prices
+    centered = Z - mean
+    return SufficientStats(list(columns) + [TARGET], len(Z), mean, centered.T @ centered)
+
+
+def merge_stats(left, right):
+    """Combine the statistics of two disjoint sets of rows
+
+    Uses the pairwise update of Chan et al. for means and centered
+    cross-products, so blocks can be accumulated in any order.
+    """
+    if left is None:
+        return right
+    n = left.n + right.n
+    delta = right.mean - left.mean
+    mean = left.mean + delta * (right.n / n)
+    comoment = left.comoment + right.comoment + np.outer(delta, delta) * (left.n * right.n / n)
+    return SufficientStats(left.columns, n, mean, comoment)
+
+
+def subtract_stats(total, part):
+    """Remove the statistics of a subset of rows from those of the full set
+
+    Inverse of merge_stats(): merge_stats(subtract_stats(total, part), part)
+    gives back total. part must describe rows that were included in total.
+    """
+    n = total.n - part.n
+    if n <= 0:
+        raise ValueError('Cannot remove {} rows from statistics over {} rows'.format(part.n, total.n))
+    mean = (total.mean * total.n - part.mean * part.n) / n
+    delta = part.mean - mean
+    comoment = total.comoment - part.comoment - np.outer(delta, delta) * (n * part.n / total.n)
+    return SufficientStats(total.columns, n, mean, comoment)
+
+
+def update_stats(stats, added=None, removed=None):
+    """Incremental refresh: fold new rows in and old rows out in O(new rows)
+
+    Arguments:
+        stats: SufficientStats of the current data.
+        added: Optional (X, y) of new rows.
+        removed: Optional (X, y) of rows to drop, e.g. sales older than the window.
+
+    Returns:
+        Updated SufficientStats, equal to the statistics of the updated rows.
+    """
+    features = stats.columns[:-1]
+    if added is not None and len(added[1]):
+        stats = merge_stats(stats, stats_from_arrays(added[0], added[1], features))
+    if removed is not None and len(removed[1]):
+        stats = subtract_stats(stats, stats_from_arrays(removed[0], removed[1], features))
+    return stats
+
+
+def save_stats(stats, path):
+    """Write sufficient statistics as a .npz of plain arrays"""
+    np.savez(path, columns=np.array(stats.columns), n=np.array(stats.n), mean=stats.mean,
+             comoment=stats.comoment)
+
+
+def load_stats(path):
+    """Read statistics written by save_stats()"""
+    with np.load(path, allow_pickle=False) as stored:
+        return SufficientStats([str(c) for c in stored['columns']], int(stored['n']),
+                               stored['mean'], stored['comoment'])
+
+
+def stats_from_frame(df, features=FEATURES, target=TARGET):
+    """Compute sufficient statistics over the rows with no missing feature or target value
+
+    Arguments:
+        df: House sales dataframe.
+        features: Feature columns to include (any subset can be solved later).
+        target: Target column.
+
+    Returns:
+        SufficientStats.
+    """
+    complete = df[list(features) + [target]].dropna()
+    return stats_from_arrays(complete[features].to_numpy(np.float64),
+                             complete[target].to_numpy(np.float64), features)
+
+
+def feature_index(stats, features):
+    """Positions of the given features in the statistics (default: all features)"""
+    if features is None:
+        features = stats.columns[:-1]
+    return list(features), [stats.columns.index(feature) for feature in features]
+
+
+def solve(stats, features=None, alpha=0.0):
+    """Solve OLS (alpha=0) or Ridge for a feature subset from sufficient statistics
+
+    Matches sklearn's LinearRegression / Ridge(alpha) with fit_intercept=True:
+    the intercept is not penalized.
+
+    Arguments:
+        stats: SufficientStats of the training data.
+        features: Feature subset (default: all features in stats).
+        alpha: Ridge regularization strength.
+
+    Returns:
+        LinearModel.
+    """
+    features, idx = feature_index(stats, features)
+    target = len(stats.columns) - 1
+    Sxx = stats.comoment[np.ix_(idx, idx)] + alpha * np.eye(len(idx))
+    Sxy = stats.comoment[idx, target]
+    try:
+        coef = np.linalg.solve(Sxx, Sxy)
+    except np.linalg.LinAlgError:
+        # Collinear features without regularization: minimum-norm solution
+        coef = np.linalg.lstsq(Sxx, Sxy, rcond=None)[0]
+    intercept = stats.mean[target] - stats.mean[idx] @ coef
+    return LinearModel(features, alpha, intercept, coef)
+
+
+def r2_from_stats(stats, model):
+    """R² of a fitted model on the data summarized by stats (e.g. a test set)"""
+    _, idx = feature_index(stats, model.features)
+    target = len(stats.columns) - 1
+    Cxx = stats.comoment[np.ix_(idx, idx)]
+    Cxy = stats.comoment[idx, target]
+    Cyy = stats.comoment[target, target]
+    # Residual sum of squares split into the centered part and the mean offset
+    offset = stats.mean[target] - model.intercept - stats.mean[idx] @ model.coef
+    sse = Cyy - 2 * model.coef @ Cxy + model.coef @ Cxx @ model.coef + stats.n * offset ** 2
+    return 1 - sse / Cyy
+
+
+def fit_variants(train_stats, variants, test_stats=None):
+    """Solve and score many (features, alpha) variants from the same statistics
+
+    Returns:
+        List of dictionaries with the model, train R² and (optionally) test R².
+    """
+    results = []
+    for features, alpha in variants:
+        model = solve(train_stats, features, alpha)
+        result = {'features': features, 'alpha': alpha, 'model': model,
+                  'r2_train': r2_from_stats(train_stats, model)}
+        if test_stats is not None:
+            result['r2_test'] = r2_from_stats(test_stats, model)
+        results.append(result)
+    return results
+
+
+def ridge_path(train_stats, alphas, features=None, test_stats=None):
+    """Ridge solutions for a whole vector of alphas from one eigendecomposition
+
+    The centered Gram matrix X'X = V diag(s²) V' is factorized once; every
+    alpha then costs O(p) in the eigenbasis: coef = V diag(1 / (s² + alpha)) V'X'y.
+    Equivalent to an SVD of the centered training design (s are its singular
+    values) and matches sklearn's Ridge(alpha) for each alpha.
+
+    Arguments:
+        train_stats: SufficientStats of the training data.
+        alphas: Regularization strengths.
+        features: Feature subset (default: all features in stats).
+        test_stats: Optional SufficientStats of a test set for test R².
+
+    Returns:
+        Dictionary with alphas, coefs (n_alphas x p), intercepts, r2_train,
+        gcv (generalized cross-validation error, lower is better) and,
+        with test_stats, r2_test.
+    """
+    features, idx = feature_index(train_stats, features)
+    target = len(train_stats.columns) - 1
+    alphas = np.asarray(alphas, dtype=np.float64)
+    Cxx = train_stats.comoment[np.ix_(idx, idx)]
+    Cxy = train_stats.comoment[idx, target]
+    Cyy = train_stats.comoment[target, target]
+
+    s2, V = np.linalg.eigh(Cxx)
+    s2 = np.clip(s2, 0, None)
+    c = V.T @ Cxy
+    # Coefficients in the eigenbasis for every alpha at once
+    shrink = 1 / (s2[None, :] + alphas[:, None])
+    coefs_eig = c[None, :] * shrink
+    coefs = coefs_eig @ V.T
+    intercepts = train_stats.mean[target] - coefs @ train_stats.mean[idx]
+
+    # Training residuals need only the eigenbasis terms
+    sse_train = Cyy - 2 * coefs_eig @ c + (coefs_eig ** 2) @ s2
+    n = train_stats.n
+    # Effective degrees of freedom (+1 for the intercept)
+    dof = (s2[None, :] * shrink).sum(axis=1) + 1
+    result = {
+        'features': features,
+        'alphas': alphas,
+        'coefs': coefs,
+        'intercepts': intercepts,
+        'r2_train': 1 - sse_train / Cyy,
+        'gcv': (sse_train / n) / (1 - dof / n) ** 2
+    }
+    if test_stats is not None:
+        result['r2_test'] = np.array([
+            r2_from_stats(test_stats, LinearModel(features, alpha, intercept, coef))
+            for alpha, intercept, coef in zip(alphas, intercepts, coefs)])
+    return result
+
+
+def poly_feature_names(features):
+    """Degree-2 feature names in PolynomialFeatures order (without the bias column)"""
+    names = list(features)
+    for i, j in zip(*np.triu_indices(len(features))):
+        names.append('{}^2'.format(features[i]) if i == j else '{} {}'.format(features[i], features[j]))
+    return names
+
+
+def poly_expand(X, center=None, scale=None):
+    """Degree-2 polynomial expansion of a block, optionally standardized first
+
+    The bias column is left out; the intercept is handled by centering.
+
+    Arguments:
+        X: Block of raw features.
+        center, scale: StandardScaler mean and scale applied before expansion.
+
+    Returns:
+        Array of shape (rows, p + p(p+1)/2).
+    """
+    X = np.asarray(X, dtype=np.float64)
+    if center is not None:
+        X = (X - center) / scale
+    i, j = np.triu_indices(X.shape[1])
+    return np.hstack([X, X[:, i] * X[:, j]])
+
+
+def scaler_from_stats(stats):
+    """StandardScaler mean and scale of the features, from raw statistics"""
+    p = len(stats.columns) - 1
+    scale = np.sqrt(np.diag(stats.comoment)[:p] / stats.n)
+    scale[scale == 0] = 1.0
+    return stats.mean[:p], scale
+
+
+def iter_blocks(X, y, block_size=BLOCK_SIZE):
+    """Yield (X, y) blocks of in-memory arrays"""
+    for start in range(0, len(X), block_size):
+        yield X[start:start + block_size], y[start:start + block_size]
+
+
+def iter_csv_blocks(path, features=FEATURES, target=TARGET, block_size=BLOCK_SIZE):
+    """Yield complete-row (X, y) blocks from a CSV file without loading it whole"""
+    for chunk in pd.read_csv(path, usecols=list(features) + [target], chunksize=block_size):
+        chunk = chunk.dropna()
+        yield chunk[features].to_numpy(np.float64), chunk[target].to_numpy(np.float64)
+
+
+def poly_stats_from_blocks(blocks, features=FEATURES, center=None, scale=None):
+    """Accumulate degree-2 polynomial statistics block by block
+
+    Only one expanded block is materialized at a time, so memory is
+    O(block_size * q + q²) for q expanded features instead of O(n * q).
+
+    Arguments:
+        blocks: Iterable of (X, y) blocks of raw features, see iter_blocks() / iter_csv_blocks().
+        features: Raw feature names.
+        center, scale: Optional StandardScaler parameters (Question 8 pipeline).
+
+    Returns:
+        SufficientStats over the expanded features, solvable with solve() / ridge_path().
+    """
+    names = poly_feature_names(features)
+    stats = None
+    for X_block, y_block in blocks:
+        stats = merge_stats(stats, stats_from_arrays(poly_expand(X_block, center, scale), y_block, names))
+    return stats
+
+
+def main():
+    from sklearn.linear_model import LinearRegression, Ridge
+    from sklearn.model_selection import train_test_split
+
+    from house_sales_data import load_house_data
+
+    df = load_house_data()
+    complete = df[FEATURES + [TARGET]].dropna()
+    X = complete[FEATURES].to_numpy(np.float64)
+    y = complete[TARGET].to_numpy(np.float64)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
+    start = time.perf_counter()
+    full_stats = stats_from_arrays(X, y, FEATURES)
+    train_stats = stats_from_arrays(X_train, y_train, FEATURES)
+    test_stats = stats_from_arrays(X_test, y_test, FEATURES)
+    scan_time = time.perf_counter() - start
+
+    print("🎯 Sufficient-statistics regression")
+    print("="*60)
+    print(f"Single scan for statistics: {scan_time * 1000:.2f} ms")
+
+    # Question 6, 7 and 9 from the statistics, checked against sklearn
+    q6 = solve(full_stats, ['sqft_living'])
+    q7 = solve(full_stats)
+    q9 = solve(train_stats, alpha=0.1)
+    sk6 = LinearRegression().fit(X[:, [FEATURES.index('sqft_living')]], y)
+    sk7 = LinearRegression().fit(X, y)
+    sk9 = Ridge(alpha=0.1).fit(X_train, y_train)
+    print(f"Q6 R² = {r2_from_stats(full_stats, q6):.4f} "
+          f"(sklearn {sk6.score(X[:, [FEATURES.index('sqft_living')]], y):.4f})")
+    print(f"Q7 R² = {r2_from_stats(full_stats, q7):.4f} (sklearn {sk7.score(X, y):.4f})")
+    print(f"Q9 test R² = {r2_from_stats(test_stats, q9):.4f} (sklearn {sk9.score(X_test, y_test):.4f})")
+
+    # Dozens of variants: drop-one-feature subsets at several alphas
+    variants = [([f for f in FEATURES if f != dropped], alpha)
+                for dropped in FEATURES for alpha in (0.0, 0.1, 1.0, 10.0)]
+    start = time.perf_counter()
+    results = fit_variants(train_stats, variants, test_stats)
+    elapsed = time.perf_counter() - start
+    best = max(results, key=lambda r: r['r2_test'])
+    print(f"\n{len(results)} variants solved in {elapsed * 1000:.2f} ms "
+          f"({elapsed / len(results) * 1e6:.1f} µs each)")
+    dropped = set(FEATURES) - set(best['features'])
+    print(f"Best: drop {dropped}, alpha={best['alpha']}, test R² = {best['r2_test']:.4f}")
+
+    # Ridge alpha path from a single factorization
+    alphas = np.logspace(-3, 6, 200)
+    start = time.perf_counter()
+    path = ridge_path(train_stats, alphas, test_stats=test_stats)
+    elapsed = time.perf_counter() - start
+    best = np.argmin(path['gcv'])
+    sk_best = Ridge(alpha=alphas[best]).fit(X_train, y_train)
+    print(f"\nRidge path over {len(alphas)} alphas in {elapsed * 1000:.2f} ms")
+    print(f"GCV-selected alpha = {alphas[best]:.4g}: train R² = {path['r2_train'][best]:.4f}, "
+          f"test R² = {path['r2_test'][best]:.4f} (sklearn {sk_best.score(X_test, y_test):.4f})")
+
+    # Daily refresh: fold the last 5% of rows in and the first 5% out
+    k = len(X) // 20
+    start = time.perf_counter()
+    updated = update_stats(stats_from_arrays(X[:-k], y[:-k], FEATURES),
+                           added=(X[-k:], y[-k:]), removed=(X[:k], y[:k]))
+    update_time = time.perf_counter() - start
+    refit = stats_from_arrays(X[k:], y[k:], FEATURES)
+    # Compare predictions: the sqft columns are collinear, so coefficients alone are ill-determined
+    updated_model, refit_model = solve(updated, alpha=0.1), solve(refit, alpha=0.1)
+    difference = np.abs((X[k:] @ updated_model.coef + updated_model.intercept)
+                        - (X[k:] @ refit_model.coef + refit_model.intercept))
+    print(f"\nIncremental update (+{k} / -{k} rows) in {update_time * 1000:.2f} ms, "
+          f"max prediction difference vs refit ${difference.max():.2e}")
+
+    # Question 8 and 10 from streamed polynomial statistics
+    from sklearn.pipeline import Pipeline
+    from sklearn.preprocessing import PolynomialFeatures, StandardScaler
+
+    center, scale = scaler_from_stats(full_stats)
+    start = time.perf_counter()
+    q8_stats = poly_stats_from_blocks(iter_blocks(X, y), FEATURES, center, scale)
+    q10_train = poly_stats_from_blocks(iter_blocks(X_train, y_train))
+    q10_test = poly_stats_from_blocks(iter_blocks(X_test, y_test))
+    elapsed = time.perf_counter() - start
+    q8 = solve(q8_stats)
+    q10 = solve(q10_train, alpha=0.1)
+    sk8 = Pipeline([('scaler', StandardScaler()), ('poly', PolynomialFeatures(degree=2)),
+                    ('regressor', LinearRegression())]).fit(X, y)
+    poly = PolynomialFeatures(degree=2)
+    sk10 = Ridge(alpha=0.1).fit(poly.fit_transform(X_train), y_train)
+    print(f"\nStreamed polynomial statistics ({len(q8_stats.columns) - 1} features) in {elapsed * 1000:.2f} ms")
+    print(f"Q8 R² = {r2_from_stats(q8_stats, q8):.4f} (sklearn {sk8.score(X, y):.4f})")
+    print(f"Q10 test R² = {r2_from_stats(q10_test, q10):.4f} "
+          f"(sklearn {sk10.score(poly.transform(X_test), y_test):.4f})")
+
+if __name__ == "__main__":
+    main()
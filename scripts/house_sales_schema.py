@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+House Sales Schema
+Memory-compact dtype plan for the King County frame
+
+pd.read_csv gives every column int64/float64 and 'date' as object strings.
+The schema below assigns each column the smallest dtype that holds its
+valid range (uint8 codes, uint16 years, float32 coordinates, category
+zipcodes), checks the data against those ranges before casting, and reports
+the bytes saved so many years of county data fit in memory.
+"""
+
+import numpy as np
+import pandas as pd
+
+from house_sales_data import DATE_FORMAT
+
+# Column -> (dtype, minimum, maximum); None bounds are not checked.
+# Integer dtypes also require whole numbers; columns with missing values use
+# the nullable equivalent (e.g. UInt8) so NaN survives the cast.
+SCHEMA = {
+    'Unnamed: 0': ('uint32', 0, None),
+    'id': ('uint64', 0, None),
+    'date': ('datetime64[s]', None, None),
+    'price': ('float32', 0, None),
+    'bedrooms': ('uint8', 0, 50),
+    'bathrooms': ('float32', 0, 20),
+    'sqft_living': ('uint32', 1, None),
+    'sqft_lot': ('uint32', 1, None),
+    'floors': ('float32', 1, 5),
+    'waterfront': ('uint8', 0, 1),
+    'view': ('uint8', 0, 4),
+    'condition': ('uint8', 1, 5),
+    'grade': ('uint8', 1, 13),
+    'sqft_above': ('uint32', 0, None),
+    'sqft_basement': ('uint32', 0, None),
+    'yr_built': ('uint16', 1800, 2100),
+    'yr_renovated': ('uint16', 0, 2100),
+    'zipcode': ('category', 98000, 98999),
+    'lat': ('float32', 47.0, 48.0),
+    'long': ('float32', -123.0, -121.0),
+    'sqft_living15': ('uint32', 0, None),
+    'sqft_lot15': ('uint32', 0, None),
+}
+
+
+def schema_violations(df, schema=SCHEMA):
+    """Check every schema column against its range and integer requirement
+
+    Returns:
+        Dictionary of column -> description for each failing column
+        (columns missing from df are reported too).
+    """
+    violations = {}
+    for column, (dtype, minimum, maximum) in schema.items():
+        if column not in df:
+            violations[column] = 'missing'
+            continue
+        if dtype.startswith('datetime64'):
+            continue
+        values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        present = values[~np.isnan(values)]
+        problems = []
+        if minimum is not None and (present < minimum).any():
+            problems.append('{} values below {}'.format(int((present < minimum).sum()), minimum))
+        if maximum is not None and (present > maximum).any():
+            problems.append('{} values above {}'.format(int((present > maximum).sum()), maximum))
+        if dtype.startswith(('uint', 'int')):
+            limits = np.iinfo(dtype)
+            if ((present < limits.min) | (present > limits.max)).any():
+                problems.append('outside {} range'.format(dtype))
+            if (present != np.round(present)).any():
+                problems.append('{} non-integer values'.format(int((present != np.round(present)).sum())))
+        if problems:
+            violations[column] = ', '.join(problems)
+    return violations
+
+
+def cast_column(series, dtype):
+    """Cast one validated column to its schema dtype"""
+    if dtype.startswith('datetime64'):
+        if not pd.api.types.is_datetime64_any_dtype(series):
+            series = pd.to_datetime(series, format=DATE_FORMAT)
+        return series.astype(dtype)
+    if dtype == 'category':
+        return series.astype('category')
+    if dtype.startswith(('uint', 'int')) and series.isna().any():
+        # Nullable integer, e.g. 'uint8' -> 'UInt8'
+        return series.astype(dtype.capitalize().replace('Uint', 'UInt'))
+    return series.astype(dtype)
+
+
+def apply_schema(df, schema=SCHEMA):
+    """Validate df against the schema and return a compact copy
+
+    Columns not in the schema are kept unchanged.
+
+    Raises:
+        ValueError: When a column is missing or holds values outside its range.
+    """
+    violations = schema_violations(df, schema)
+    if violations:
+        raise ValueError('Schema violations: {}'.format(
+            '; '.join('{}: {}'.format(column, problem) for column, problem in violations.items())))
+    return df.assign(**{column: cast_column(df[column], dtype) for column, (dtype, _, _) in schema.items()})
+
+
+def memory_report(before, after):
+    """Per-column bytes and dtypes of two versions of a frame, with a total row"""
+    report = pd.DataFrame({
+        'dtype_before': before.dtypes.astype(str),
+        'dtype_after': after.dtypes.astype(str),
+        'bytes_before': before.memory_usage(index=False, deep=True),
+        'bytes_after': after.memory_usage(index=False, deep=True),
+    })
+    report.loc['total'] = ['', '', report['bytes_before'].sum(), report['bytes_after'].sum()]
+    report['ratio'] = report['bytes_before'] / report['bytes_after']
+    return report
+
+
+if __name__ == '__main__':
+    from house_sales_data import DATA_PATH
+
+    raw = pd.read_csv(DATA_PATH)
+    compact = apply_schema(raw)
+    report = memory_report(raw, compact)
+    print(report.to_string(float_format=lambda v: f"{v:.1f}"))
+    total = report.loc['total']
+    print(f"\n📊 {total['bytes_before'] / 1e6:.2f} MB -> {total['bytes_after'] / 1e6:.2f} MB "
+          f"({total['ratio']:.1f}x smaller)")
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+House Price Batch Scoring
+Serialized King County price model and a chunked batch scorer
+
+Trains the Question 8 model (StandardScaler -> PolynomialFeatures(2) ->
+LinearRegression, optionally Ridge) from streamed sufficient statistics and
+saves it as a small .npz artifact. The scorer reads listings in fixed-size
+chunks from CSV or Parquet, scores each chunk with one matrix product and
+appends the predictions to the output, so memory stays bounded for full
+county exports.
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from house_sales_regression import (FEATURES, TARGET, iter_blocks, load_stats, merge_stats,
+                                    poly_expand, poly_stats_from_blocks, save_stats,
+                                    scaler_from_stats, solve, stats_from_frame, subtract_stats)
+
+MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'outputs', 'models',
+                          'house_price_model.npz')
+IMPUTER_PATH = os.path.join(os.path.dirname(MODEL_PATH), 'house_price_imputer.json')
+STATS_PATH = os.path.join(os.path.dirname(MODEL_PATH), 'house_price_stats.npz')
+SCORE_CHUNK_SIZE = 100000
+
+# Degree-2 polynomial price model: price = intercept + poly(scale(X)) @ coef, fitted with
+# Ridge alpha on rows cleaned by imputer (house_sales_cleaning fill values, None = rows dropped)
+PriceModel = namedtuple('PriceModel', ['features', 'center', 'scale', 'intercept', 'coef', 'alpha', 'imputer'],
+                        defaults=(0.0, None))
+
+
+def training_stats(df, features, center, scale):
+    """Polynomial sufficient statistics of the complete rows of df under a fixed scaler"""
+    complete = df[list(features) + [TARGET]].dropna()
+    return poly_stats_from_blocks(iter_blocks(complete[features].to_numpy(np.float64),
+                                              complete[TARGET].to_numpy(np.float64)),
+                                  features, center, scale)
+
+
+def train_model(df, features=FEATURES, alpha=0.0, imputer=None):
+    """Fit the scaled polynomial price model on the complete rows of df
+
+    Arguments:
+        df: House sales dataframe, already cleaned with imputer when one is given.
+        features: Feature columns.
+        alpha: Ridge alpha (0 = OLS), kept in the model for update_model().
+        imputer: Fill values df was cleaned with, kept in the model so
+            update_model() cleans new rows the same way.
+
+    Returns:
+        Tuple of (PriceModel, polynomial SufficientStats for later update_model() calls).
+    """
+    complete = df[list(features) + [TARGET]].dropna()
+    center, scale = scaler_from_stats(stats_from_frame(complete, features))
+    stats = training_stats(complete, features, center, scale)
+    model = solve(stats, alpha=alpha)
+    return PriceModel(list(features), center, scale, model.intercept, model.coef, alpha, imputer), stats
+
+
+def update_model(model, stats, added=None, removed=None, alpha=None):
+    """Refresh the model with new sales (and without old ones) in O(changed rows)
+
+    The scaler is kept from the original fit. For OLS the predictions equal a
+    full refit exactly (the degree-2 basis is closed under rescaling); for
+    Ridge the penalty stays expressed in the original scale. Added and
+    removed rows are cleaned with the model's imputer, like the training rows.
+
+    Arguments:
+        model: PriceModel to refresh.
+        stats: Polynomial statistics the model was solved from.
+        added: Optional dataframe of new sales.
+        removed: Optional dataframe of sales to drop; they must be part of stats.
+        alpha: Ridge alpha for the new solve, default the alpha the model was trained with.
+
+    Returns:
+        Tuple of (updated PriceModel, updated statistics).
+    """
+    alpha = model.alpha if alpha is None else alpha
+    if model.imputer is not None:
+        from house_sales_cleaning import apply_imputer
+
+        added = apply_imputer(added, model.imputer) if added is not None else None
+        removed = apply_imputer(removed, model.imputer) if removed is not None else None
+    if added is not None and len(added):
+        stats = merge_stats(stats, training_stats(added, model.features, model.center, model.scale))
+    if removed is not None and len(removed):
+        stats = subtract_stats(stats, training_stats(removed, model.features, model.center, model.scale))
+    solved = solve(stats, alpha=alpha)
+    return model._replace(intercept=solved.intercept, coef=solved.coef, alpha=alpha), stats
+
+
+def save_model(model, path=MODEL_PATH):
+    """Write the model artifact (.npz of plain arrays, no pickle; the imputer as a JSON string)"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    np.savez(path, features=np.array(model.features), center=model.center, scale=model.scale,
+             intercept=np.array(model.intercept), coef=model.coef, alpha=np.array(model.alpha),
+             imputer=np.array(json.dumps(model.imputer)))
+
+
+def load_model(path=MODEL_PATH):
+    """Read a model artifact written by save_model()
+
+    Artifacts saved before alpha and imputer were recorded load as an OLS
+    model trained on complete rows.
+    """
+    with np.load(path, allow_pickle=False) as artifact:
+        alpha = float(artifact['alpha']) if 'alpha' in artifact.files else 0.0
+        imputer = json.loads(str(artifact['imputer'])) if 'imputer' in artifact.files else None
+        return PriceModel([str(f) for f in artifact['features']], artifact['center'], artifact['scale'],
+                          float(artifact['intercept']), artifact['coef'], alpha, imputer)
+
+
+def predict(model, X):
+    """Vectorized prediction for a block of listings (NaN where a feature is missing)"""
+    return model.intercept + poly_expand(X, model.center, model.scale) @ model.coef
+
+
+def iter_listing_chunks(path, columns, chunksize=SCORE_CHUNK_SIZE):
+    """Yield dataframe chunks of the requested columns from a CSV or Parquet file"""
+    if path.endswith('.parquet'):
+        # Optional dependency, only needed for Parquet input
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunksize)
+
+
+def score_file(model, input_path, output_path, chunksize=SCORE_CHUNK_SIZE, id_column='id', imputer=None):
+    """Score a listings file chunk by chunk and append predictions to a CSV
+
+    Arguments:
+        model: PriceModel.
+        input_path: CSV or Parquet file with the model's feature columns.
+        output_path: Output CSV with the id column (when present) and predicted_price.
+        chunksize: Rows per chunk, bounds memory use.
+        id_column: Column copied to the output to identify listings.
+        imputer: Optional fill values from house_sales_cleaning, applied to each chunk.
+
+    Returns:
+        Tuple of (rows scored, elapsed seconds).
+    """
+    if input_path.endswith('.parquet'):
+        import pyarrow.parquet as pq
+
+        available = pq.ParquetFile(input_path).schema_arrow.names
+    else:
+        available = pd.read_csv(input_path, nrows=0).columns
+    missing = [feature for feature in model.features if feature not in available]
+    if missing:
+        raise ValueError('Input is missing feature columns: {}'.format(missing))
+    columns = model.features + ([id_column] if id_column in available else [])
+    if imputer is not None and imputer['strategy'] == 'zipcode_median':
+        from house_sales_cleaning import GROUP_COLUMN
+
+        columns = columns + ([GROUP_COLUMN] if GROUP_COLUMN not in columns else [])
+
+    rows = 0
+    start = time.perf_counter()
+    for i, chunk in enumerate(iter_listing_chunks(input_path, columns, chunksize)):
+        if imputer is not None:
+            from house_sales_cleaning import apply_imputer
+
+            chunk = apply_imputer(chunk, imputer)
+        out = pd.DataFrame({'predicted_price': predict(model, chunk[model.features].to_numpy(np.float64))})
+        if id_column in chunk:
+            out.insert(0, id_column, chunk[id_column].to_numpy())
+        out.to_csv(output_path, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+        rows += len(chunk)
+    return rows, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Train and batch-score the house price model')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    train = subparsers.add_parser('train', help='fit the model on the King County data and save it')
+    train.add_argument('--alpha', type=float, default=0.0, help='Ridge alpha (0 = Question 8 OLS)')
+    train.add_argument('--model', default=MODEL_PATH, help='artifact path')
+    train.add_argument('--impute', choices=['mean', 'median', 'zipcode_median'], default=None,
+                       help='impute missing bedrooms/bathrooms instead of dropping rows')
+    train.add_argument('--imputer', default=IMPUTER_PATH, help='where to save the fill values')
+    train.add_argument('--stats', default=STATS_PATH, help='where to save the training statistics')
+    update = subparsers.add_parser('update', help='fold new sales into the saved model without refitting')
+    update.add_argument('--add', default=None, help='CSV of new sales')
+    update.add_argument('--remove', default=None, help='CSV of previously included sales to drop')
+    update.add_argument('--alpha', type=float, default=None,
+                        help='Ridge alpha for the new solve (default: the alpha the model was trained with)')
+    update.add_argument('--model', default=MODEL_PATH, help='artifact path, updated in place')
+    update.add_argument('--stats', default=STATS_PATH, help='training statistics, updated in place')
+    score = subparsers.add_parser('score', help='score a CSV/Parquet file of listings')
+    score.add_argument('input', help='listings file with the 11 feature columns')
+    score.add_argument('output', help='output CSV of predictions')
+    score.add_argument('--model', default=MODEL_PATH, help='artifact path')
+    score.add_argument('--chunksize', type=int, default=SCORE_CHUNK_SIZE, help='rows per chunk')
+    score.add_argument('--imputer', default=None,
+                       help='fill values saved by train --impute (default: those stored in the model)')
+    args = parser.parse_args()
+
+    if args.command == 'train':
+        imputer = None
+        if args.impute:
+            from house_sales_cleaning import load_clean_house_data, save_imputer
+
+            df, imputer = load_clean_house_data(args.impute)
+        else:
+            from house_sales_data import load_house_data
+
+            df = load_house_data()
+        model, stats = train_model(df, alpha=args.alpha, imputer=imputer)
+        save_model(model, args.model)
+        save_stats(stats, args.stats)
+        print(f"✅ Model saved: {args.model} ({len(model.coef)} polynomial terms)")
+        if args.impute:
+            save_imputer(imputer, args.imputer)
+            print(f"✅ Fill values saved: {args.imputer}")
+    elif args.command == 'update':
+        start = time.perf_counter()
+        added = pd.read_csv(args.add) if args.add else None
+        removed = pd.read_csv(args.remove) if args.remove else None
+        model, stats = update_model(load_model(args.model), load_stats(args.stats), added, removed,
+                                    alpha=args.alpha)
+        save_model(model, args.model)
+        save_stats(stats, args.stats)
+        print(f"✅ Model updated in {time.perf_counter() - start:.2f}s "
+              f"(+{0 if added is None else len(added)} / -{0 if removed is None else len(removed)} rows, "
+              f"{stats.n:,} training rows)")
+    else:
+        model = load_model(args.model)
+        imputer = model.imputer
+        if args.imputer:
+            from house_sales_cleaning import load_imputer
+
+            imputer = load_imputer(args.imputer)
+        rows, elapsed = score_file(model, args.input, args.output, args.chunksize, imputer=imputer)
+        print(f"✅ Scored {rows:,} listings in {elapsed:.2f}s ({rows / elapsed:,.0f} rows/sec)")
+        print(f"📁 Predictions: {args.output}")
+
+if __name__ == "__main__":
+    main()
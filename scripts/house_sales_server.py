@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+House Price Prediction Endpoint
+Low-latency single-listing inference with micro-batching
+
+Concurrent single-row requests are queued and coalesced by a background
+thread into micro-batches (up to --max-batch-size rows, waiting at most
+--max-wait-ms for the batch to fill), scored with one vectorized matrix
+product. Latency, queue-wait and batch-size histograms are exposed at /metrics.
+
+Endpoints:
+    POST /predict   {"floors": 2, "waterfront": 0, ...}  -> {"predicted_price": ...}
+    GET  /metrics   histograms as JSON
+    GET  /health
+"""
+
+import argparse
+import bisect
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+from flask import Flask, jsonify, request
+
+from house_sales_scoring import MODEL_PATH, load_model, predict
+
+LATENCY_BUCKETS_MS = [0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000]
+BATCH_SIZE_BUCKETS = [1, 2, 4, 8, 16, 32, 64, 128, 256]
+
+
+class Histogram:
+    """Thread-safe histogram with fixed bucket upper bounds"""
+
+    def __init__(self, buckets):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, value):
+        with self.lock:
+            self.counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.total += value
+
+    def snapshot(self):
+        """Bucket counts keyed by upper bound ('+Inf' for the overflow bucket), count and mean"""
+        with self.lock:
+            labels = ['<={}'.format(bound) for bound in self.buckets] + ['+Inf']
+            return {'buckets': dict(zip(labels, self.counts)), 'count': self.count,
+                    'mean': self.total / self.count if self.count else None}
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-row predictions into vectorized batches
+
+    Arguments:
+        model: PriceModel from house_sales_scoring.
+        max_batch_size: Largest number of rows scored together.
+        max_wait_ms: Longest time the first queued row waits for the batch to fill.
+    """
+
+    def __init__(self, model, max_batch_size=64, max_wait_ms=2.0):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.queue = queue.Queue()
+        self.latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.queue_wait_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.batch_size = Histogram(BATCH_SIZE_BUCKETS)
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def submit(self, features):
+        """Queue one row of features and block until its prediction is ready"""
+        start = time.perf_counter()
+        future = Future()
+        self.queue.put((np.asarray(features, dtype=np.float64), future, start))
+        result = future.result()
+        self.latency_ms.observe((time.perf_counter() - start) * 1000)
+        return result
+
+    def _collect(self):
+        """Wait for a first row, then gather more until the batch is full or max_wait expires"""
+        batch = [self.queue.get()]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            now = time.perf_counter()
+            for _, _, queued in batch:
+                self.queue_wait_ms.observe((now - queued) * 1000)
+            self.batch_size.observe(len(batch))
+            try:
+                predictions = predict(self.model, np.vstack([row for row, _, _ in batch]))
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future, _), prediction in zip(batch, predictions):
+                future.set_result(float(prediction))
+
+    def metrics(self):
+        return {'latency_ms': self.latency_ms.snapshot(), 'queue_wait_ms': self.queue_wait_ms.snapshot(),
+                'batch_size': self.batch_size.snapshot(), 'max_batch_size': self.max_batch_size,
+                'max_wait_ms': self.max_wait * 1000}
+
+
+def create_app(batcher):
+    """Flask app exposing the micro-batched model"""
+    app = Flask(__name__)
+    # Keep histogram buckets in bound order
+    app.json.sort_keys = False
+    features = batcher.model.features
+
+    @app.route('/predict', methods=['POST'])
+    def predict_listing():
+        listing = request.get_json(silent=True) or {}
+        if not isinstance(listing, dict):
+            return jsonify({'error': 'body must be a JSON object of features'}), 400
+        missing = [feature for feature in features if listing.get(feature) is None]
+        if missing:
+            return jsonify({'error': 'missing features', 'missing': missing}), 400
+        try:
+            row = [float(listing[feature]) for feature in features]
+        except (TypeError, ValueError):
+            return jsonify({'error': 'features must be numeric'}), 400
+        # float() accepts "nan"/"inf" (and JSON NaN/Infinity), which would predict NaN
+        if not np.isfinite(row).all():
+            return jsonify({'error': 'features must be finite'}), 400
+        return jsonify({'predicted_price': batcher.submit(row)})
+
+    @app.route('/metrics')
+    def metrics():
+        return jsonify(batcher.metrics())
+
+    @app.route('/health')
+    def health():
+        return jsonify({'status': 'ok', 'features': features})
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Micro-batched house price prediction endpoint')
+    parser.add_argument('--model', default=MODEL_PATH, help='artifact from house_sales_scoring.py train')
+    parser.add_argument('--port', type=int, default=8060)
+    parser.add_argument('--max-batch-size', type=int, default=64, help='rows per micro-batch')
+    parser.add_argument('--max-wait-ms', type=float, default=2.0, help='longest wait for a batch to fill')
+    args = parser.parse_args()
+
+    batcher = MicroBatcher(load_model(args.model), args.max_batch_size, args.max_wait_ms)
+    print(f"🎯 Serving {args.model} on http://127.0.0.1:{args.port}/predict")
+    create_app(batcher).run(port=args.port, threaded=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+House Sales Neighbourhood Features
+KD-tree spatial index over listing lat/long
+
+Listings are projected to kilometres and indexed once in a KD-tree, so the
+k nearest neighbours and all neighbours within a radius are found in
+O(n log n) instead of O(n²) pairwise distances. From the neighbours the
+module derives median price per sqft features that the regression models
+consume alongside the 11 notebook features. A listing's own sale is never
+counted among its neighbours, so the features do not leak its price.
+"""
+
+import time
+import warnings
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from house_sales_regression import FEATURES, TARGET
+
+EARTH_RADIUS_KM = 6371.0
+KNN_K = 10
+RADIUS_KM = 1.0
+NEIGHBOURHOOD_FEATURES = ['knn_median_ppsf', 'knn_distance_km', 'radius_median_ppsf', 'radius_count']
+
+# Reference listings: KD-tree over projected coordinates, their price per sqft and ids
+SpatialIndex = namedtuple('SpatialIndex', ['tree', 'price_per_sqft', 'ids', 'origin'])
+
+
+def project_km(lat, long, origin):
+    """Equirectangular projection of degrees to kilometres around origin=(lat, long)
+
+    Accurate to well under 1% across a county, which is all the distances need.
+    """
+    lat0, long0 = np.radians(origin)
+    x = EARTH_RADIUS_KM * (np.radians(long) - long0) * np.cos(lat0)
+    y = EARTH_RADIUS_KM * (np.radians(lat) - lat0)
+    return np.column_stack([x, y])
+
+
+def build_spatial_index(df):
+    """Index the listings with a known price, sqft_living and location
+
+    Arguments:
+        df: House sales dataframe with lat, long, price and sqft_living.
+
+    Returns:
+        SpatialIndex over the usable rows.
+    """
+    usable = df[['lat', 'long', TARGET, 'sqft_living']].notna().all(axis=1) & (df['sqft_living'] > 0)
+    known = df[usable]
+    origin = (float(known['lat'].mean()), float(known['long'].mean()))
+    points = project_km(known['lat'].to_numpy(np.float64), known['long'].to_numpy(np.float64), origin)
+    price_per_sqft = (known[TARGET] / known['sqft_living']).to_numpy(np.float64)
+    return SpatialIndex(cKDTree(points), price_per_sqft, known.index.to_numpy(), origin)
+
+
+def grouped_median(groups, values, n_groups):
+    """Median of values per group id in one sort (NaN for empty groups)"""
+    order = np.lexsort((values, groups))
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    sorted_values = values[order]
+    median = np.full(n_groups, np.nan)
+    has = counts > 0
+    lower = sorted_values[starts[has] + (counts[has] - 1) // 2]
+    upper = sorted_values[starts[has] + counts[has] // 2]
+    median[has] = (lower + upper) / 2
+    return median
+
+
+def neighbourhood_features(index, df, k=KNN_K, radius_km=RADIUS_KM):
+    """Neighbour price statistics for each listing in df
+
+    Listings that are themselves in the index (same dataframe index label)
+    are excluded from their own neighbourhood.
+
+    Arguments:
+        index: SpatialIndex from build_spatial_index().
+        df: Listings with lat and long.
+        k: Number of nearest neighbours.
+        radius_km: Radius for the within-radius statistics.
+
+    Returns:
+        Dataframe aligned with df with the NEIGHBOURHOOD_FEATURES columns.
+    """
+    n = len(df)
+    points = project_km(df['lat'].to_numpy(np.float64), df['long'].to_numpy(np.float64), index.origin)
+    located = ~np.isnan(points).any(axis=1)
+    # Position of each listing in the index, -1 when it is not a reference listing
+    own = pd.Index(index.ids).get_indexer(df.index)
+
+    # k nearest: ask for one extra so dropping the listing itself still leaves k
+    distance, neighbour = index.tree.query(points[located], k=k + 1)
+    # Small indexes pad missing neighbours with index.tree.n; those are never kept
+    found = neighbour < index.tree.n
+    is_self = neighbour == own[located, None]
+    keep = ~is_self & found
+    keep[~is_self.any(axis=1), k] = False
+    ppsf = np.where(keep, index.price_per_sqft[np.minimum(neighbour, index.tree.n - 1)], np.nan)
+    knn_median = np.full(n, np.nan)
+    knn_distance = np.full(n, np.nan)
+    with warnings.catch_warnings():
+        # A listing with no other listing in the index gets NaN features, not a warning
+        warnings.simplefilter('ignore', RuntimeWarning)
+        knn_median[located] = np.nanmedian(ppsf, axis=1)
+        knn_distance[located] = np.nanmean(np.where(keep, distance, np.nan), axis=1)
+
+    # Within radius: all (listing, neighbour) pairs from one tree-to-tree traversal
+    query_tree = cKDTree(points[located])
+    pairs = query_tree.sparse_distance_matrix(index.tree, radius_km, output_type='ndarray')
+    rows = np.flatnonzero(located)[pairs['i']]
+    pairs_kept = pairs['j'] != own[rows]
+    rows = rows[pairs_kept]
+    radius_median = grouped_median(rows, index.price_per_sqft[pairs['j'][pairs_kept]], n)
+    radius_count = np.bincount(rows, minlength=n)
+    # Isolated listings with no neighbour within the radius fall back to the kNN median
+    radius_median = np.where(radius_count > 0, radius_median, knn_median)
+
+    return pd.DataFrame({'knn_median_ppsf': knn_median, 'knn_distance_km': knn_distance,
+                         'radius_median_ppsf': radius_median,
+                         'radius_count': radius_count.astype(np.float64)}, index=df.index)
+
+
+def add_neighbourhood_features(df, index=None, k=KNN_K, radius_km=RADIUS_KM):
+    """Feature-engineering step: df with the NEIGHBOURHOOD_FEATURES columns appended
+
+    Builds the index over df itself unless a training index is given, which
+    is how held-out or new listings should be featurized.
+    """
+    if index is None:
+        index = build_spatial_index(df)
+    return df.join(neighbourhood_features(index, df, k, radius_km))
+
+
+def brute_force_radius_median(index, df, radius_km=RADIUS_KM):
+    """O(n·m) pairwise reference for radius_median_ppsf, used to check the index"""
+    points = project_km(df['lat'].to_numpy(np.float64), df['long'].to_numpy(np.float64), index.origin)
+    own = pd.Index(index.ids).get_indexer(df.index)
+    medians = []
+    for i, point in enumerate(points):
+        near = np.sqrt(((index.tree.data - point) ** 2).sum(axis=1)) <= radius_km
+        if own[i] >= 0:
+            near[own[i]] = False
+        medians.append(np.median(index.price_per_sqft[near]) if near.any() else np.nan)
+    return np.array(medians)
+
+
+def main():
+    from sklearn.model_selection import train_test_split
+
+    from house_sales_data import load_house_data
+    from house_sales_regression import r2_from_stats, solve, stats_from_frame
+
+    df = load_house_data()
+    train, test = train_test_split(df, test_size=0.2, random_state=42)
+
+    start = time.perf_counter()
+    index = build_spatial_index(train)
+    train = add_neighbourhood_features(train, index)
+    test = add_neighbourhood_features(test, index)
+    elapsed = time.perf_counter() - start
+    print(f"🎯 Neighbourhood features for {len(df):,} listings (k={KNN_K}, r={RADIUS_KM} km)")
+    print("="*60)
+    print(f"Index build + queries: {elapsed * 1000:.1f} ms")
+
+    # Check against pairwise distances for indexed (train) and new (test) listings
+    sample = pd.concat([train.iloc[:100], test.iloc[:100]])
+    start = time.perf_counter()
+    reference = brute_force_radius_median(index, sample)
+    brute = (time.perf_counter() - start) * len(df) / len(sample)
+    print(f"Pairwise reference (extrapolated to all listings): {brute * 1000:.1f} ms, "
+          f"max difference {np.nanmax(np.abs(reference - sample['radius_median_ppsf'])):.2e}")
+
+    for label, features in (('11 features', FEATURES),
+                            ('11 features + neighbourhood', FEATURES + NEIGHBOURHOOD_FEATURES)):
+        model = solve(stats_from_frame(train, features), features)
+        print(f"✅ {label:28} test R² = {r2_from_stats(stats_from_frame(test, features), model):.4f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Parallel, Incremental Screenshot Runner
+Renders every create_* figure function of the screenshot scripts
+
+Figure functions are discovered in the screenshot modules and rendered in a
+process pool with the Agg backend. A manifest in outputs/screenshots/ records
+a hash of each function's source and inputs, so unchanged figures whose
+outputs still exist are skipped.
+"""
+
+import argparse
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SCREENSHOTS_DIR = os.path.join(SCRIPTS_DIR, '..', 'outputs', 'screenshots')
+MANIFEST_PATH = os.path.join(SCREENSHOTS_DIR, 'manifest.json')
+
+# Screenshot modules and their output folder; when two functions write the same
+# file (e.g. Title.png), the one from the later module wins
+SCREENSHOT_MODULES = [
+    ('create_house_sales_screenshots', 'house_sales'),
+    ('create_code_screenshots', 'automobile_sales'),
+    ('create_dashboard_screenshots', 'automobile_sales'),
+    ('create_enhanced_task2_screenshots', 'automobile_sales'),
+]
+
+
+def import_screenshot_module(module_name):
+    """Import a screenshot module with the non-interactive Agg backend"""
+    os.environ['MPLBACKEND'] = 'Agg'
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+    return importlib.import_module(module_name)
+
+
+def discover_figure_functions(module):
+    """Return the module's create_* functions that take no arguments"""
+    functions = []
+    for name, obj in inspect.getmembers(module, inspect.isfunction):
+        if not name.startswith('create_') or obj.__module__ != module.__name__:
+            continue
+        if all(p.default is not p.empty for p in inspect.signature(obj).parameters.values()):
+            functions.append(obj)
+    # Keep source order
+    return sorted(functions, key=lambda f: f.__code__.co_firstlineno)
+
+
+def referenced_names(code):
+    """Global names referenced by a code object, including nested code objects"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= referenced_names(const)
+    return names
+
+
+def function_hash(func, seen=None):
+    """Hash a figure function's source and inputs
+
+    Covers the function source, the source of helper functions from the same
+    module that it calls, and the values of simple module-level constants it
+    reads (e.g. code snippets rendered into a screenshot).
+    """
+    import matplotlib
+
+    seen = set() if seen is None else seen
+    seen.add(func.__name__)
+    digest = hashlib.sha256(inspect.getsource(func).encode())
+    digest.update(matplotlib.__version__.encode())
+    for name in sorted(referenced_names(func.__code__)):
+        value = func.__globals__.get(name)
+        if inspect.isfunction(value) and value.__module__ == func.__module__:
+            if name not in seen:
+                digest.update(function_hash(value, seen).encode())
+        elif isinstance(value, (str, int, float, tuple, list, dict)):
+            digest.update('{}={!r}'.format(name, value).encode())
+    return digest.hexdigest()
+
+
+def render_figure(module_name, function_name, staging_dir):
+    """Worker: render one figure function into its own staging directory
+
+    Returns:
+        List of file names produced by the function.
+    """
+    module = import_screenshot_module(module_name)
+    os.makedirs(staging_dir, exist_ok=True)
+    cwd = os.getcwd()
+    os.chdir(staging_dir)
+    try:
+        getattr(module, function_name)()
+    finally:
+        os.chdir(cwd)
+    return sorted(os.listdir(staging_dir))
+
+
+def load_manifest():
+    """Read the render manifest, empty when missing"""
+    try:
+        with open(MANIFEST_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(manifest):
+    """Write the render manifest"""
+    with open(MANIFEST_PATH, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def collect_jobs():
+    """List (key, module name, function name, output folder, hash) for every figure function"""
+    jobs = []
+    for module_name, folder in SCREENSHOT_MODULES:
+        module = import_screenshot_module(module_name)
+        for func in discover_figure_functions(module):
+            key = '{}.{}'.format(module_name, func.__name__)
+            jobs.append((key, module_name, func.__name__, folder, function_hash(func)))
+    return jobs
+
+
+def is_up_to_date(entry, folder, source_hash):
+    """A figure is skipped when its hash matches and all its outputs still exist"""
+    if not entry or entry.get('hash') != source_hash:
+        return False
+    return all(os.path.exists(os.path.join(SCREENSHOTS_DIR, folder, name)) for name in entry['outputs'])
+
+
+def run(workers=None, force=False, only=None):
+    """Render all out-of-date figures in a process pool and update the manifest
+
+    Returns:
+        Tuple of (rendered keys, skipped keys, {failed key: error}).
+    """
+    manifest = load_manifest()
+    # All jobs take part in output ownership below, so a filtered run never
+    # overwrites a file that a module later in SCREENSHOT_MODULES owns
+    jobs = collect_jobs()
+    selected = [job for job in jobs if not only or only in job[0]]
+    pending = [job for job in selected if force or not is_up_to_date(manifest.get(job[0]), job[3], job[4])]
+    rendered = {}
+    failed = {}
+
+    if pending:
+        staging_root = tempfile.mkdtemp(prefix='screenshots-')
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {job[0]: pool.submit(render_figure, job[1], job[2], os.path.join(staging_root, job[0]))
+                           for job in pending}
+                for key, future in futures.items():
+                    try:
+                        rendered[key] = future.result()
+                    except Exception as e:
+                        # A broken figure must not block the others; it is retried next run
+                        failed[key] = e
+
+            # Owner of each output file: the last job (in module order) that produces it
+            owners = {}
+            for key, _, _, folder, _ in jobs:
+                if key in failed:
+                    continue
+                outputs = rendered[key] if key in rendered else manifest.get(key, {}).get('outputs', [])
+                for name in outputs:
+                    owners[(folder, name)] = key
+
+            for key, _, _, folder, source_hash in pending:
+                if key in failed:
+                    continue
+                os.makedirs(os.path.join(SCREENSHOTS_DIR, folder), exist_ok=True)
+                for name in rendered[key]:
+                    if owners[(folder, name)] == key:
+                        shutil.move(os.path.join(staging_root, key, name),
+                                    os.path.join(SCREENSHOTS_DIR, folder, name))
+                manifest[key] = {'hash': source_hash, 'outputs': rendered[key]}
+        finally:
+            shutil.rmtree(staging_root, ignore_errors=True)
+        save_manifest(manifest)
+
+    skipped = [job[0] for job in selected if job[0] not in rendered and job[0] not in failed]
+    return list(rendered), skipped, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render screenshot figures in parallel, skipping unchanged ones')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='re-render every figure')
+    parser.add_argument('--only', default=None, help='only figures whose module.function contains this text')
+    args = parser.parse_args()
+
+    print("🎯 Rendering screenshots...")
+    print("="*60)
+    start = time.perf_counter()
+    rendered, skipped, failed = run(workers=args.workers, force=args.force, only=args.only)
+    elapsed = time.perf_counter() - start
+
+    for key in rendered:
+        print(f"✅ Rendered: {key}")
+    for key, error in failed.items():
+        print(f"❌ Failed: {key}: {error}")
+    print(f"\n🎉 {len(rendered)} rendered, {len(skipped)} up to date, {len(failed)} failed in {elapsed:.1f}s")
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Production Server for the Dash Dashboards
+Multi-process WSGI entry point for the automobile sales and airline apps
+
+The dashboards' own __main__ blocks start the Flask development server. This
+entry point serves the same Flask app (app.server) under gunicorn with
+several worker processes. The app module is imported once in the master
+process (preload) and everything workers read is materialized before forking:
+the generated sales data, aggregate cube and figure cache, or the airline
+year partitions and report payloads. Workers then share those pages
+copy-on-write instead of regenerating or re-reading the data.
+gc.freeze() moves the preloaded objects out of the garbage collector's
+generations, so collections in the workers do not write to (and copy) the
+shared pages.
+
+The bench command starts a server, sends concurrent callback requests and
+reports throughput, latency and the memory of the server processes.
+"""
+
+import argparse
+import gc
+import importlib.machinery
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+import numpy as np
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+AIRLINE_APP_PATH = os.path.join(SCRIPTS_DIR, '..', 'tempCodeRunnerFile.python')
+DEFAULT_PORTS = {'automobile': 8050, 'airline': 8051}
+
+
+def load_automobile_app():
+    """Import the automobile dashboard and pre-render every report into its figure cache"""
+    import automobile_sales_dashboard as dashboard
+
+    dashboard.warm_figure_cache()
+    return dashboard.app
+
+
+def load_airline_app():
+    """Import the airline dashboard, materialize all year partitions and report payloads"""
+    # The app lives in a file without a .py suffix, so give importlib an explicit loader
+    loader = importlib.machinery.SourceFileLoader('airline_dashboard', AIRLINE_APP_PATH)
+    spec = importlib.util.spec_from_loader('airline_dashboard', loader)
+    dashboard = importlib.util.module_from_spec(spec)
+    sys.modules['airline_dashboard'] = dashboard
+    loader.exec_module(dashboard)
+
+    for year in dashboard.year_list:
+        dashboard.get_year_partition(year)
+    if os.environ.get('AIRLINE_PRECOMPUTE', '1') == '1':
+        for future in dashboard.precompute_report_payloads(wait=True):
+            future.result()
+    for chart in dashboard.REPORT_TYPES:
+        for year in dashboard.year_list:
+            dashboard.read_report_payload(chart, year)
+    return dashboard.app
+
+
+APP_LOADERS = {'automobile': load_automobile_app, 'airline': load_airline_app}
+
+
+def preload(name):
+    """Load an app in the master process and freeze the loaded objects for copy-on-write sharing"""
+    app = APP_LOADERS[name]()
+    gc.collect()
+    gc.freeze()
+    return app.server
+
+
+def serve(name, port, workers, threads, timeout=120):
+    """Serve an app under gunicorn with preloaded, forked workers"""
+    from gunicorn.app.base import BaseApplication
+
+    class DashboardApplication(BaseApplication):
+        def __init__(self, server, options):
+            self.server = server
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return self.server
+
+    server = preload(name)
+    options = {'bind': '127.0.0.1:{}'.format(port), 'workers': workers, 'threads': threads,
+               'worker_class': 'gthread' if threads > 1 else 'sync', 'preload_app': True,
+               'timeout': timeout, 'accesslog': None}
+    DashboardApplication(server, options).run()
+
+
+def callback_bodies(name):
+    """Report callback request bodies covering every report type and year of an app
+
+    Built here rather than from the app modules, so the load generator does
+    not load the dataset itself.
+    """
+    if name == 'automobile':
+        reports = [('Recession Period Statistics', None)] + [('Yearly Statistics', year)
+                                                            for year in range(1980, 2014)]
+        return [{
+            'output': 'output-container.children',
+            'outputs': {'id': 'output-container', 'property': 'children'},
+            'inputs': [{'id': 'dropdown-statistics', 'property': 'value', 'value': report},
+                       {'id': 'select-year', 'property': 'value', 'value': year}],
+            'changedPropIds': ['select-year.value'],
+            'state': []
+        } for report, year in reports]
+    # The airline dropdowns reach the server through the clientside report-selection store
+    plots = ['plot{}'.format(i) for i in range(1, 6)]
+    return [{
+        'output': '..' + '...'.join('{}.children'.format(plot) for plot in plots) + '..',
+        'outputs': [{'id': plot, 'property': 'children'} for plot in plots],
+        'inputs': [{'id': 'report-selection', 'property': 'data', 'value': {'chart': chart, 'year': year}}],
+        'changedPropIds': ['report-selection.data'],
+        'state': [{'id': plot, 'property': 'children'} for plot in plots]
+    } for chart in ('OPT1', 'OPT2') for year in range(2005, 2021)]
+
+
+def wait_until_ready(url, process, timeout=300):
+    """Poll the server until it answers, failing early if the process exits"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError('Server exited with code {}'.format(process.returncode))
+        try:
+            urllib.request.urlopen(url, timeout=5).read()
+            return
+        except OSError:
+            time.sleep(0.5)
+    raise RuntimeError('Server did not start within {}s'.format(timeout))
+
+
+def process_tree_pss(pid):
+    """Proportional set size (bytes) of a process and its children, shared pages split between them
+
+    Reads /proc/<pid>/smaps_rollup (Linux), None elsewhere.
+    """
+    pids = [pid]
+    try:
+        with open('/proc/{}/task/{}/children'.format(pid, pid)) as f:
+            pids += [int(child) for child in f.read().split()]
+        total = 0
+        for p in pids:
+            with open('/proc/{}/smaps_rollup'.format(p)) as f:
+                total += next(int(line.split()[1]) * 1024 for line in f if line.startswith('Pss:'))
+        return total
+    except (OSError, StopIteration):
+        return None
+
+
+def load_test(url, bodies, concurrency, duration):
+    """Send callback requests from concurrent client threads for a fixed duration
+
+    Returns:
+        List of request latencies in ms.
+    """
+    latencies = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client(offset):
+        i = offset
+        while time.perf_counter() < deadline:
+            request = urllib.request.Request(url + '/_dash-update-component',
+                                             data=json.dumps(bodies[i % len(bodies)]).encode(),
+                                             headers={'Content-Type': 'application/json'})
+            start = time.perf_counter()
+            urllib.request.urlopen(request, timeout=60).read()
+            with lock:
+                latencies.append((time.perf_counter() - start) * 1000)
+            i += 1
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies
+
+
+def bench(name, port, modes, concurrency, duration):
+    """Throughput of the development server versus gunicorn with several worker counts"""
+    bodies = callback_bodies(name)
+    url = 'http://127.0.0.1:{}'.format(port)
+    print(f"🎯 {name} dashboard: {concurrency} concurrent clients, {duration}s per mode")
+    print("="*60)
+    for mode in modes:
+        if mode == 'dev':
+            # The app modules' own entry points: Flask development server
+            code = ('import serve_dashboards as s; '
+                    'app = s.APP_LOADERS[{!r}](); app.run(port={}, debug=False)').format(name, port)
+            command = [sys.executable, '-c', code]
+        else:
+            command = [sys.executable, os.path.join(SCRIPTS_DIR, 'serve_dashboards.py'), 'serve', name,
+                       '--port', str(port), '--workers', mode]
+        process = subprocess.Popen(command, cwd=SCRIPTS_DIR, stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.DEVNULL)
+        try:
+            wait_until_ready(url + '/', process)
+            load_test(url, bodies, concurrency, 1)
+            latencies = load_test(url, bodies, concurrency, duration)
+            pss = process_tree_pss(process.pid)
+        finally:
+            process.terminate()
+            process.wait()
+        label = 'dev server' if mode == 'dev' else 'gunicorn x{}'.format(mode)
+        p50, p95 = np.percentile(latencies, [50, 95])
+        memory = f"{pss / 1e6:7.1f} MB PSS" if pss else ""
+        print(f"{label:14} {len(latencies) / duration:8.1f} req/s  p50={p50:7.2f}ms  p95={p95:7.2f}ms  {memory}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve the Dash dashboards with multiple worker processes')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    serve_parser = subparsers.add_parser('serve', help='run an app under gunicorn')
+    serve_parser.add_argument('app', choices=sorted(APP_LOADERS))
+    serve_parser.add_argument('--port', type=int, default=None, help='default: 8050 automobile, 8051 airline')
+    serve_parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='worker processes')
+    serve_parser.add_argument('--threads', type=int, default=1, help='threads per worker')
+    bench_parser = subparsers.add_parser('bench', help='compare dev server and gunicorn throughput')
+    bench_parser.add_argument('app', choices=sorted(APP_LOADERS))
+    bench_parser.add_argument('--port', type=int, default=8099)
+    bench_parser.add_argument('--modes', nargs='+', default=['dev', '1', '2', '4'],
+                              help="'dev' and/or gunicorn worker counts")
+    bench_parser.add_argument('--concurrency', type=int, default=8, help='concurrent clients')
+    bench_parser.add_argument('--duration', type=float, default=10, help='seconds per mode')
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        serve(args.app, args.port or DEFAULT_PORTS[args.app], args.workers, args.threads)
+    else:
+        bench(args.app, args.port, args.modes, args.concurrency, args.duration)
+
+if __name__ == "__main__":
+    main()
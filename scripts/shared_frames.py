@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Shared Dataset Handoff Between Worker Processes
+Publish DataFrames once as memory-mapped columns, attach zero-copy
+
+The first process to need a dataset builds it (one or more named frames) and
+publishes every column as a raw .npy file in shared memory (/dev/shm where
+available); categorical and string columns are stored as integer codes plus
+their categories. Every other worker process attaches by memory-mapping the
+same files, so the dataset occupies one copy of physical memory however many
+workers run.
+
+Unlike copy-on-write preloading this also works for workers that are not
+forked from a loaded master (spawned workers, gunicorn without --preload,
+worker restarts). Files are used rather than multiprocessing.shared_memory
+segments because the resource tracker of Python < 3.13 unlinks segments
+when an attaching worker exits.
+
+Published datasets stay in RAM-backed tmpfs until removed or reboot:
+python shared_frames.py lists them and --remove NAME deletes them.
+"""
+
+import argparse
+import fcntl
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+SHARED_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+MANIFEST_VERSION = 1
+
+
+def default_shared_dir(name):
+    """Shared location for a named dataset, e.g. /dev/shm/automobile_sales"""
+    return os.path.join(SHARED_ROOT, name)
+
+
+def source_hash(*objects):
+    """Short hash of the source code of functions, classes and modules and the repr of other values
+
+    Include it in the attach_shared() key so editing a build function (or the
+    constants it reads) republishes the dataset instead of attaching stale data.
+    """
+    digest = hashlib.sha256()
+    for obj in objects:
+        has_source = inspect.isroutine(obj) or inspect.isclass(obj) or inspect.ismodule(obj)
+        text = inspect.getsource(obj) if has_source else repr(obj)
+        digest.update(text.encode())
+    return digest.hexdigest()[:16]
+
+
+def column_values(series):
+    """Array to publish for a column: integer codes for categorical/string data, else the values"""
+    if isinstance(series.dtype, pd.CategoricalDtype) or (
+            not pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_datetime64_any_dtype(series)):
+        categorical = series.astype('category')
+        return categorical.cat.codes.to_numpy(), categorical.cat.categories.tolist()
+    return series.to_numpy(), None
+
+
+def read_manifest(directory):
+    """Read the published manifest, None when missing or unreadable"""
+    try:
+        with open(os.path.join(directory, 'manifest.json')) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_manifest(directory, manifest):
+    """Write the manifest under a temporary name and rename it into place"""
+    tmp_path = os.path.join(directory, 'manifest.json.{}.tmp'.format(os.getpid()))
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(directory, 'manifest.json'))
+
+
+def publish_frames(frames, directory, key=None):
+    """Write the columns of each frame to directory and a manifest describing them
+
+    Each file is written under a temporary name and renamed into place, so
+    workers still mapping an older version keep reading intact data.
+
+    Arguments:
+        frames: Dictionary of name to DataFrame (indexes are not kept).
+        directory: Shared directory for the column files.
+        key: JSON-serializable description of how the frames were built;
+            attach_shared() rebuilds when it differs.
+
+    Returns:
+        The manifest dictionary.
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest = {'version': MANIFEST_VERSION, 'key': key, 'frames': {}}
+    for name, df in frames.items():
+        columns = []
+        for i, column in enumerate(df.columns):
+            values, categories = column_values(df[column])
+            filename = '{}_{:03d}.npy'.format(name, i)
+            tmp_path = os.path.join(directory, '{}.{}.tmp'.format(filename, os.getpid()))
+            with open(tmp_path, 'wb') as f:
+                np.save(f, np.ascontiguousarray(values))
+            os.replace(tmp_path, os.path.join(directory, filename))
+            entry = {'name': column, 'file': filename, 'dtype': str(values.dtype)}
+            if categories is not None:
+                entry['categories'] = categories
+            columns.append(entry)
+        manifest['frames'][name] = {'rows': len(df), 'columns': columns}
+    # Written last, so readers never see a manifest pointing at missing or partial columns
+    write_manifest(directory, manifest)
+    return manifest
+
+
+def attach_frames(directory, manifest=None, mmap=True):
+    """Map published frames read-only without copying column data
+
+    Categorical columns keep their codes memory-mapped. The frames are
+    read-only: with pandas copy-on-write, modifications make a private copy.
+    With mmap=False the columns are read into memory instead.
+
+    Returns:
+        Dictionary of name to DataFrame.
+    """
+    manifest = manifest or read_manifest(directory)
+    frames = {}
+    for name, frame in manifest['frames'].items():
+        arrays = {}
+        for column in frame['columns']:
+            values = np.load(os.path.join(directory, column['file']), mmap_mode='r' if mmap else None)
+            if 'categories' in column:
+                values = pd.Categorical.from_codes(values, column['categories'])
+            arrays[column['name']] = values
+        # copy=False keeps each column backed by its memory map
+        frames[name] = pd.DataFrame(arrays, copy=False)
+    return frames
+
+
+def attach_shared(directory, build, key=None):
+    """Attach to published frames, building and publishing them first when needed
+
+    A file lock makes concurrent workers wait for the first one to publish
+    instead of all building the dataset.
+
+    Arguments:
+        directory: Shared directory, see default_shared_dir().
+        build: Function returning a dictionary of name to DataFrame, called by the first worker only.
+        key: Build description stored in the manifest; a different key triggers a rebuild.
+
+    Returns:
+        Tuple of (dictionary of name to DataFrame backed by the shared files,
+        whether this call built and published them).
+    """
+    # Compare keys the way they are stored (e.g. tuples become lists in JSON)
+    key = json.loads(json.dumps(key))
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, '.lock'), 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            manifest = read_manifest(directory)
+            published = manifest is None or manifest.get('version') != MANIFEST_VERSION \
+                or manifest.get('key') != key
+            if published:
+                manifest = publish_frames(build(), directory, key)
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+    return attach_frames(directory, manifest), published
+
+
+def published_datasets(root=SHARED_ROOT):
+    """Names and total bytes of the datasets published under root"""
+    datasets = {}
+    for name in sorted(os.listdir(root)):
+        directory = os.path.join(root, name)
+        if os.path.isdir(directory) and read_manifest(directory) is not None:
+            datasets[name] = sum(os.path.getsize(os.path.join(directory, f)) for f in os.listdir(directory))
+    return datasets
+
+
+def remove_shared(directory):
+    """Delete a published dataset and free its shared memory
+
+    Taken under the publish lock. Workers that already mapped the columns
+    keep reading them; the memory is released when the last one unmaps.
+    """
+    if not os.path.isdir(directory):
+        return
+    with open(os.path.join(directory, '.lock'), 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            shutil.rmtree(directory)
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='List or remove datasets published in shared memory')
+    parser.add_argument('--remove', nargs='+', default=[], metavar='NAME',
+                        help='dataset names to delete, e.g. automobile_sales airline_aggregates')
+    args = parser.parse_args()
+
+    for name in args.remove:
+        remove_shared(default_shared_dir(name))
+        print(f"🗑️  Removed {default_shared_dir(name)}")
+    datasets = published_datasets()
+    print(f"📁 Published datasets in {SHARED_ROOT}:")
+    for name, size in datasets.items():
+        print(f"   • {name}: {size / 1e6:.1f} MB")
+    if not datasets:
+        print("   (none)")
+
+if __name__ == "__main__":
+    main()